@@ -0,0 +1,514 @@
+# Benchmark griffe-typedoc on synthetic TypeDoc outputs.
+#
+# Usage: python scripts/benchmark.py [--size SIZE] [BENCHMARK ...]
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import gc
+import importlib.util
+import json
+import re
+import sys
+import tempfile
+import time
+import tracemalloc
+from itertools import count
+from pathlib import Path
+from typing import Any, Callable
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from griffe_typedoc import TypedocDecoder, load_json, load_snapshot, save_snapshot
+from griffe_typedoc._internal import decoder
+from griffe_typedoc._internal.backends import _parsers
+from griffe_typedoc._internal.generated_loaders import _load_comment, _load_source, _load_type
+from griffe_typedoc._internal.models import Type, TypeKind, _collect_targets
+
+# Number of modules, classes per module and members per class.
+SIZES = {
+    "small": (2, 5, 5),
+    "medium": (20, 20, 20),
+    "huge": (100, 50, 40),
+}
+
+BENCHMARKS: dict[str, Callable[[Path], None]] = {}
+
+
+def benchmark(func: Callable[[Path], None]) -> Callable[[Path], None]:
+    BENCHMARKS[func.__name__.removeprefix("bench_").replace("_", "-")] = func
+    return func
+
+
+def synthetic_project(modules: int, classes: int, members: int) -> dict[str, Any]:
+    ids = count(1)
+
+    def reflection(kind: int, name: str, variant: str = "declaration", **fields: Any) -> dict:
+        return {
+            "id": fields.pop("id") if "id" in fields else next(ids),
+            "name": name,
+            "variant": variant,
+            "kind": kind,
+            "flags": {},
+            **fields,
+        }
+
+    def source(file: str, line: int) -> list[dict]:
+        return [{"fileName": file, "line": line, "character": 2, "url": f"https://example.com/{file}#L{line}"}]
+
+    def comment(text: str) -> dict:
+        return {
+            "summary": [
+                {"kind": "text", "text": f"{text}, see "},
+                {"kind": "inline-tag", "tag": "@link", "text": "Base", "target": 1},
+                {"kind": "text", "text": "."},
+            ],
+            "blockTags": [{"tag": "@remarks", "content": [{"kind": "code", "text": "`example()`"}]}],
+        }
+
+    def intrinsic(name: str) -> dict:
+        return {"type": "intrinsic", "name": name}
+
+    def member(file: str, class_id: int, index: int) -> dict:
+        line = index * 10
+        if index % 2:
+            return reflection(
+                1024,
+                f"property{index}",
+                comment=comment(f"Property {index}"),
+                sources=source(file, line),
+                type={"type": "union", "types": [intrinsic("string"), intrinsic("undefined")]},
+            )
+        method_id = next(ids)
+        parameter = reflection(32768, "value", "param", type={"type": "array", "elementType": intrinsic("number")})
+        signature = reflection(
+            4096,
+            f"method{index}",
+            "signature",
+            comment=comment(f"Method {index}"),
+            sources=source(file, line),
+            parameters=[parameter],
+            type={"type": "reference", "target": class_id, "name": "Self", "package": "synthetic"},
+        )
+        return reflection(2048, f"method{index}", id=method_id, sources=source(file, line), signatures=[signature])
+
+    def klass(file: str, index: int) -> dict:
+        class_id = next(ids)
+        children = [member(file, class_id, member_index) for member_index in range(members)]
+        return reflection(
+            128,
+            f"Class{index}",
+            id=class_id,
+            comment=comment(f"Class {index}"),
+            children=children,
+            groups=[{"title": "Members", "children": [child["id"] for child in children]}],
+            sources=source(file, 1),
+        )
+
+    def module(index: int) -> dict:
+        module_id = next(ids)
+        file = f"src/module{index}.ts"
+        children = [klass(file, class_index) for class_index in range(classes)]
+        return reflection(
+            2,
+            f"module{index}",
+            id=module_id,
+            children=children,
+            groups=[{"title": "Classes", "children": [child["id"] for child in children]}],
+            sources=source(file, 1),
+        )
+
+    children = [module(index) for index in range(modules)]
+    return reflection(
+        1,
+        "synthetic",
+        "project",
+        id=0,
+        children=children,
+        groups=[{"title": "Modules", "children": [child["id"] for child in children]}],
+        packageName="synthetic",
+        symbolIdMap={},
+        files={
+            "entries": {str(index): child["sources"][0]["fileName"] for index, child in enumerate(children, 1)},
+            "reflections": {str(index): child["id"] for index, child in enumerate(children, 1)},
+        },
+    )
+
+
+def timeit(func: Callable[[], Any], repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def peak_memory(func: Callable[[], Any]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = func()  # noqa: F841
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def report(name: str, seconds: float | None = None, memory: int | None = None) -> None:
+    columns = [f"{name:<40}"]
+    if seconds is not None:
+        columns.append(f"{seconds * 1000:>10.1f} ms")
+    if memory is not None:
+        columns.append(f"{memory / 1024 / 1024:>10.1f} MiB")
+    print(*columns)
+
+
+@benchmark
+def bench_streaming(path: Path) -> None:
+    def standard() -> Any:
+        with path.open(encoding="utf8") as file:
+            return json.load(file, cls=TypedocDecoder)
+
+    def streaming() -> Any:
+        return load_json(path, streaming=True)
+
+    for name, func in (("json.load + TypedocDecoder", standard), ("load_json(streaming=True)", streaming)):
+        report(name, timeit(func), peak_memory(func))
+
+
+# Key translation of the decoder before loaders were generated, for comparison.
+_re_word_end = re.compile("(.)([A-Z][a-z]+)")
+_re_word_start = re.compile("([a-z0-9])([A-Z])")
+
+
+def _camel_to_snake(key: str) -> str:
+    return _re_word_start.sub(r"\1_\2", _re_word_end.sub(r"\1_\2", key)).lower()
+
+
+_loaders = {"type": _load_type, "source": _load_source, "comment": _load_comment}
+
+
+@benchmark
+def bench_generated_loaders(path: Path) -> None:
+    snake_keys: dict[str, str] = {}
+
+    def splat(cls: type, obj_dict: dict[str, Any]) -> Any:
+        # Previous implementation: rename keys through a table, intern variants, splat keyword arguments.
+        kwargs = {}
+        for key, value in obj_dict.items():
+            if (snake := snake_keys.get(key)) is None:
+                snake = snake_keys[key] = _camel_to_snake(key)
+            kwargs[snake] = value
+        if "variant" in kwargs:
+            kwargs["variant"] = sys.intern(kwargs["variant"])
+        if cls is Type:
+            return Type(type=TypeKind(kwargs.pop("type")), **kwargs)
+        return cls(**kwargs)
+
+    samples = _hook_samples(path)
+    for category in ("reflection", "type", "source", "comment"):
+        calls = []
+        for obj_dict in samples[category]:
+            loader = decoder._kind_loaders[obj_dict.pop("kind")] if category == "reflection" else _loaders[category]
+            calls.append((loader, obj_dict, type(loader(obj_dict, {}))))
+        previous = timeit(lambda: [splat(cls, obj_dict) for _, obj_dict, cls in calls])  # noqa: B023
+        generated = timeit(lambda: [loader(obj_dict, {}) for loader, obj_dict, _ in calls])  # noqa: B023
+        report(f"{category}: key table + splat ({len(calls)} objects)", previous)
+        report(f"{category}: generated loaders ({len(calls)} objects)", generated)
+
+    def decode() -> Any:
+        with path.open(encoding="utf8") as file:
+            return json.load(file, cls=TypedocDecoder)
+
+    report("json.load + TypedocDecoder", timeit(decode))
+
+
+def _hook_samples(path: Path) -> dict[str, list[dict]]:
+    # Record objects per shape, as seen by the decoder's object hook (children already decoded).
+    samples: dict[str, list[dict]] = {}
+    hook = TypedocDecoder()._object_hook
+
+    def recording_hook(obj_dict: dict) -> Any:
+        if "kind" in obj_dict:
+            category = "reflection" if isinstance(obj_dict["kind"], int) else "block tag content"
+        elif "tag" in obj_dict:
+            category = "block tag"
+        elif "summary" in obj_dict:
+            category = "comment"
+        elif "fileName" in obj_dict:
+            category = "source"
+        elif "type" in obj_dict:
+            category = "type"
+        elif set(obj_dict) == {"title", "children"}:
+            category = "group"
+        else:
+            category = "other"
+        samples.setdefault(category, []).append(obj_dict.copy())
+        return hook(obj_dict)
+
+    json.loads(path.read_text(), object_hook=recording_hook)
+    return samples
+
+
+@benchmark
+def bench_object_hook(path: Path) -> None:
+    for category, objects in sorted(_hook_samples(path).items()):
+        best = float("inf")
+        for _ in range(5):
+            copies = [obj_dict.copy() for obj_dict in objects]
+            hook = TypedocDecoder()._object_hook
+            gc.collect()
+            start = time.perf_counter()
+            for obj_dict in copies:
+                hook(obj_dict)
+            best = min(best, time.perf_counter() - start)
+        print(f"{category:<40}{best / len(objects) * 1e9:>10.0f} ns/object ({len(objects)} objects)")
+
+
+def _instance_size(obj: Any) -> int:
+    size = sys.getsizeof(obj)
+    if hasattr(obj, "__dict__"):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+@benchmark
+def bench_model_memory(path: Path) -> None:
+    def decode() -> Any:
+        with path.open(encoding="utf8") as file:
+            return json.load(file, cls=TypedocDecoder)
+
+    gc.collect()
+    tracemalloc.start()
+    project = decode()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    sizes: dict[str, list[int]] = {}
+    seen: set[int] = set()
+
+    def visit(obj: Any) -> None:
+        if isinstance(obj, list):
+            for item in obj:
+                visit(item)
+        elif hasattr(obj, "__dataclass_fields__") and id(obj) not in seen:
+            # Shared instances (intrinsic and literal types) are counted once.
+            seen.add(id(obj))
+            sizes.setdefault(type(obj).__name__, []).append(_instance_size(obj))
+            for name in obj.__dataclass_fields__:
+                if name not in ("parent", "symbol_id_map"):
+                    visit(getattr(obj, name))
+
+    visit(project)
+    for name, instance_sizes in sorted(sizes.items(), key=lambda item: -len(item[1])):
+        print(f"{name:<40}{instance_sizes[0]:>10} bytes/object ({len(instance_sizes)} objects)")
+    report("whole project (retained)", memory=retained)
+
+
+@benchmark
+def bench_paths(path: Path) -> None:
+    project = load_json(path)
+    reflections = list(project.symbol_id_map.values())
+
+    def paths() -> None:
+        for reflection in reflections:
+            reflection.path  # noqa: B018
+            reflection.root_module  # noqa: B018
+
+    report(f"first access ({len(reflections)} reflections)", timeit(paths, repeat=1))
+    report(f"next accesses ({len(reflections)} reflections)", timeit(paths))
+
+
+@benchmark
+def bench_lookup(path: Path) -> None:
+    project = load_json(path)
+
+    def walk(reflection: Any, target: str) -> Any:
+        if reflection.path == target:
+            return reflection
+        for child in reflection._child_reflections():
+            if (found := walk(child, target)) is not None:
+                return found
+        return None
+
+    report("build indexes", timeit(project._build_indexes, repeat=1))
+    paths = list(project._path_index)
+    # Spread across the whole tree, so that walking visits half of it on average.
+    sample = paths[:: max(1, len(paths) // 20)]
+
+    def walking() -> None:
+        for target in sample:
+            walk(project, target)
+
+    def lookup() -> None:
+        for target in paths:
+            project.lookup(target)
+
+    def lookup_name() -> None:
+        for target in paths:
+            project.lookup_name(target.rsplit("/", 1)[-1])
+
+    report(f"walking children ({len(sample)} paths)", timeit(walking, repeat=1))
+    report(f"lookup ({len(paths)} paths)", timeit(lookup))
+    report(f"lookup_name ({len(paths)} names)", timeit(lookup_name))
+
+
+@benchmark
+def bench_references(path: Path) -> None:
+    contents = path.read_bytes()
+    report("decode", timeit(lambda: load_json(contents)))
+    report("decode with reverse references", timeit(lambda: load_json(contents, reverse_references=True)))
+
+    project = load_json(contents)
+    report("build reverse references on first use", timeit(project._build_references, repeat=1))
+    reflections = list(project.symbol_id_map.values())
+
+    def targets_of(reflection: Any) -> dict[int, None]:
+        targets: dict[int, None] = {}
+        for reflection_field in dataclasses.fields(reflection):
+            if reflection_field.init and reflection_field.name != "parent":
+                _collect_targets(getattr(reflection, reflection_field.name), targets)
+        return targets
+
+    def scan() -> None:
+        for target in reflections[:10]:
+            [reflection for reflection in reflections if target.id in targets_of(reflection)]
+
+    def referenced_by() -> None:
+        for target in reflections:
+            project.referenced_by(target)
+
+    report("scanning the project (10 targets)", timeit(scan, repeat=1))
+    report(f"referenced_by ({len(reflections)} targets)", timeit(referenced_by))
+
+
+@benchmark
+def bench_groups(path: Path) -> None:
+    project = load_json(path)
+    reflections = [reflection for reflection in project.symbol_id_map.values() if reflection.groups]
+
+    def resolve() -> None:
+        for reflection in reflections:
+            for group in reflection.resolved_groups:
+                for child in group.children:
+                    reflection.group_title(child)  # type: ignore[arg-type]
+
+    report(f"first access ({len(reflections)} grouped reflections)", timeit(resolve, repeat=1))
+    report(f"next accesses ({len(reflections)} grouped reflections)", timeit(resolve))
+
+
+@benchmark
+def bench_target_resolution(path: Path) -> None:
+    project = load_json(path)
+    reflections = list(project.symbol_id_map.values())
+    # Signatures return a reference type targeting their class.
+    targets = [
+        (reflection, reflection.type.target)
+        for reflection in reflections
+        if reflection.type is not None and isinstance(reflection.type.target, int)
+    ]
+
+    def resolve() -> None:
+        for reflection, target in targets:
+            reflection.symbol_map[target]
+
+    report(f"direct project reference ({len(targets)} targets)", timeit(resolve))
+    for reflection in reflections:
+        reflection.project = None
+    report(f"walking up parents ({len(targets)} targets)", timeit(resolve))
+
+
+@benchmark
+def bench_snapshot(path: Path) -> None:
+    snapshot_path = path.with_suffix(".snapshot")
+    save_snapshot(load_json(path), snapshot_path)
+
+    def decode() -> Any:
+        return load_json(path)
+
+    def restore() -> Any:
+        return load_snapshot(snapshot_path)
+
+    report(f"load_json ({path.stat().st_size / 1024 / 1024:.1f} MiB)", timeit(decode))
+    report(f"load_snapshot ({snapshot_path.stat().st_size / 1024 / 1024:.1f} MiB)", timeit(restore))
+
+
+@benchmark
+def bench_backends(path: Path) -> None:
+    contents = path.read_bytes()
+    for backend, parse in _parsers.items():
+        if backend != "json" and importlib.util.find_spec(backend) is None:
+            report(f"{backend} (not installed)")
+            continue
+        report(f"{backend}, parse only", timeit(lambda parse=parse: parse(contents)))  # type: ignore[misc]
+        report(f"{backend}, eager", timeit(lambda backend=backend: load_json(contents, backend=backend)))  # type: ignore[misc]
+        report(f"{backend}, lazy", timeit(lambda backend=backend: load_json(contents, backend=backend, lazy=True)))  # type: ignore[misc]
+
+
+@benchmark
+def bench_linking(path: Path) -> None:
+    contents = path.read_bytes()
+    report("decode", timeit(lambda: load_json(contents)))
+    project = load_json(contents)
+    reflections = list(project.symbol_id_map.values())
+    report(f"link pass alone ({len(reflections)} reflections)", timeit(lambda: decoder._link(reflections)))
+
+
+@benchmark
+def bench_lazy(path: Path) -> None:
+    def visit(reflection: Any) -> None:
+        for child in reflection.children:
+            visit(child)
+        for signature in getattr(reflection, "signatures", None) or ():
+            signature.type  # noqa: B018
+
+    def eager() -> Any:
+        project = load_json(path)
+        visit(project.children[0])
+        return project
+
+    def lazy() -> Any:
+        project = load_json(path, lazy=True)
+        visit(project.children[0])
+        return project
+
+    def lazy_all() -> Any:
+        project = load_json(path, lazy=True)
+        visit(project)
+        return project
+
+    for name, func in (
+        ("eager, one module", eager),
+        ("lazy, one module", lazy),
+        ("lazy, all modules", lazy_all),
+    ):
+        report(name, timeit(func), peak_memory(func))
+
+
+def main(args: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="benchmark")
+    parser.add_argument("benchmarks", nargs="*", metavar="BENCHMARK", help="Benchmarks to run (default: all).")
+    parser.add_argument("-s", "--size", choices=SIZES, default="medium", help="Size of the synthetic project.")
+    parser.add_argument("-l", "--list", action="store_true", help="List available benchmarks.")
+    opts = parser.parse_args(args)
+    if opts.list:
+        print(*BENCHMARKS, sep="\n")
+        return 0
+    if unknown := set(opts.benchmarks) - set(BENCHMARKS):
+        parser.error(f"unknown benchmarks: {', '.join(sorted(unknown))}")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir, "project.json")
+        with path.open("w", encoding="utf8") as file:
+            json.dump(synthetic_project(*SIZES[opts.size]), file, indent="\t")
+        print(f"Synthetic project: {opts.size}, {path.stat().st_size / 1024 / 1024:.1f} MiB")
+        for name in opts.benchmarks or BENCHMARKS:
+            print(f"\n# {name}")
+            BENCHMARKS[name](path)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,235 @@
+# Script to generate the decoder's loaders from the in-tree TypeDoc schema.
+#
+# Usage: python scripts/gen_decoder.py [--check]
+
+from __future__ import annotations
+
+import argparse
+import inspect
+import json
+import re
+import sys
+from dataclasses import MISSING, Field, fields
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from griffe_typedoc._internal import models
+
+SCHEMA_PATH = Path(__file__).with_name("typedoc_schema.json")
+OUTPUT_PATH = Path(__file__).parent.parent / "src" / "griffe_typedoc" / "_internal" / "generated_loaders.py"
+# Maximum line length, see `config/ruff.toml`.
+LINE_LENGTH = 120
+
+HEADER = """\
+# This module contains loaders converting TypeDoc's JSON objects to models.
+# It is generated from `scripts/typedoc_schema.json` by `scripts/gen_decoder.py`: do not edit it by hand.
+# Objects are created without calling `__init__`: every field is assigned explicitly,
+# reading camelCase keys directly instead of translating them and splatting keyword arguments.
+
+from __future__ import annotations
+
+import sys
+from functools import partial
+from typing import Any, Callable
+
+"""
+
+_re_word_end = re.compile("(.)([A-Z][a-z]+)")
+_re_word_start = re.compile("([a-z0-9])([A-Z])")
+
+
+def _camel_to_snake(key: str) -> str:
+    return _re_word_start.sub(r"\1_\2", _re_word_end.sub(r"\1_\2", key)).lower()
+
+
+def _loader_name(model: str) -> str:
+    return f"_load_{_camel_to_snake(model)}"
+
+
+def _properties(schema: dict[str, Any], model: str) -> dict[str, dict[str, Any]]:
+    spec = schema[model]
+    properties = _properties(schema, spec["extends"]) if "extends" in spec else {}
+    properties.update(spec.get("properties", {}))
+    return properties
+
+
+def _default(model: str, model_field: Field, imports: dict[str, set[str]]) -> str:
+    # Expression giving the default value of a field.
+    factory = model_field.default_factory
+    if isinstance(factory, type) and factory not in (list, dict):
+        imports.setdefault(factory.__module__, set()).add(factory.__name__)
+        return f"{factory.__name__}()"
+    if factory is not MISSING:
+        value = factory()
+    elif model_field.default is not MISSING:
+        value = model_field.default
+    else:
+        raise ValueError(f"{model}: field '{model_field.name}' is not in the schema")
+    if value is not None and not isinstance(value, (bool, int, str, list, dict)):
+        raise ValueError(f"{model}: field '{model_field.name}' has an unsupported default value {value!r}")
+    return repr(value)
+
+
+def _value(key: str, spec: dict[str, Any], default: str | None) -> str:
+    # Expression giving the value of a field, from the JSON object.
+    if spec.get("symbolMap"):
+        return "symbol_id_map"
+    if default is None:
+        value = f'obj_dict["{key}"]'
+        if spec.get("intern"):
+            return f"sys.intern({value})"
+        if enum := spec.get("enum"):
+            return f"{enum}({value})"
+        return value
+    if spec.get("intern"):
+        return f'sys.intern(value) if (value := get("{key}")) is not None else {default}'
+    if default == "None":
+        return f'get("{key}")'
+    if default in ("[]", "{}"):
+        return f'get("{key}") or {default}'
+    return f'get("{key}", {default})'
+
+
+def _slot_name(model: str, name: str) -> str:
+    return f"_{_camel_to_snake(model)}_{name}_slot"
+
+
+def _loader(
+    model: str,
+    properties: dict[str, dict[str, Any]],
+    kind_enum: str | None,
+    imports: dict[str, set[str]],
+    slots: list[str],
+) -> list[str]:
+    model_class = getattr(models, model)
+    model_fields = {model_field.name: model_field for model_field in fields(model_class)}
+    values = {}
+    if kind_enum:
+        values["kind"] = "kind"
+    for key, spec in properties.items():
+        name = _camel_to_snake(key)
+        if name not in model_fields or not model_fields[name].init:
+            raise ValueError(f"{model}: property '{key}' has no matching field '{name}'")
+        model_field = model_fields[name]
+        required = model_field.default is MISSING and model_field.default_factory is MISSING
+        values[name] = _value(key, spec, None if required else _default(model, model_field, imports))
+    for name, model_field in model_fields.items():
+        # Fields absent from the schema are either not serialized (like parents, assigned once
+        # the whole document is decoded), or not initialized (like memoized values): use their defaults.
+        if name not in values:
+            values[name] = _default(model, model_field, imports)
+
+    # Only reflections are registered in the symbol map.
+    is_reflection = issubclass(model_class, models.Reflection)
+    parameters = ["obj_dict: dict[str, Any]", f"{'' if is_reflection else '_'}symbol_id_map: dict[int, Any]"]
+    if kind_enum:
+        parameters.insert(0, f"kind: {kind_enum}")
+    definition = f"def {_loader_name(model)}({', '.join(parameters)}) -> {model}:"
+    if len(definition) > LINE_LENGTH:
+        lines = [f"def {_loader_name(model)}(", *(f"    {parameter}," for parameter in parameters), f") -> {model}:"]
+    else:
+        lines = [definition]
+    if any("get(" in value for value in values.values()):
+        lines.append("    get = obj_dict.get")
+    lines.append(f"    obj = {model}.__new__({model})")
+    # Assign fields in their declaration order, like `__init__`.
+    for name in model_fields:
+        if isinstance(inspect.getattr_static(model_class, name), models._PathSlot):
+            # New objects have nothing memoized: bypass invalidation.
+            slot = _slot_name(model, name)
+            slots.append(f"{slot} = _{name}_slots[{model}]")
+            lines.append(f"    {slot}.__set__(obj, {values[name]})")
+        else:
+            lines.append(f"    obj.{name} = {values[name]}")
+    if is_reflection:
+        lines.append("    symbol_id_map[obj.id] = obj")
+    lines.append("    return obj")
+    return lines
+
+
+def generate(schema_path: Path = SCHEMA_PATH) -> str:
+    """Generate the source of the loaders module.
+
+    Parameters:
+        schema_path: Path to the schema.
+
+    Returns:
+        The module's source.
+    """
+    schema = json.loads(schema_path.read_text(encoding="utf8"))["models"]
+    imports = {
+        models.__name__: {"BlockTagContentKind", "BlockTagKind", "ReflectionKind", "_name_slots", "_parent_slots"},
+    }
+    functions = []
+    slots: list[str] = []
+    loader_map = []
+    for model, spec in schema.items():
+        if spec.get("abstract"):
+            continue
+        imports[models.__name__].add(model)
+        kind_enum = spec.get("kindEnum")
+        properties = _properties(schema, model)
+        imports[models.__name__].update(prop["enum"] for prop in properties.values() if "enum" in prop)
+        functions.append("\n".join(_loader(model, properties, kind_enum, imports, slots)))
+        loader = _loader_name(model)
+        if reflection_kind := spec.get("reflectionKind"):
+            member = models.ReflectionKind(reflection_kind).name
+            loader_map.append(f"    ReflectionKind.{member}: {loader},")
+        elif kind_enum:
+            loader_map.extend(
+                f"    {kind_enum}.{member.name}: partial({loader}, {kind_enum}.{member.name}),"
+                for member in getattr(models, kind_enum)
+            )
+
+    import_lines = []
+    for module, names in sorted(imports.items()):
+        # Sort classes before private variables, like isort.
+        sorted_names = sorted(names, key=lambda name: (name.startswith("_"), name))
+        statement = f"from {module} import {', '.join(sorted_names)}"
+        if len(statement) > LINE_LENGTH:
+            import_lines.extend((f"from {module} import (", *(f"    {name}," for name in sorted_names), ")"))
+        else:
+            import_lines.append(statement)
+    map_lines = [
+        "# Loaders of reflections, block tags and block tag contents, by kind.",
+        "_loader_map: dict[",
+        "    ReflectionKind | BlockTagKind | BlockTagContentKind,",
+        "    Callable[[dict[str, Any], dict[int, Any]], Any],",
+        "] = {",
+        *loader_map,
+        "}",
+    ]
+    slot_lines = [
+        "# Underlying slots of each reflection class, whose wrappers clear memoized values.",
+        *slots,
+    ]
+    sections = ["\n".join(slot_lines), *functions, "\n".join(map_lines)]
+    return HEADER + "\n".join(import_lines) + "\n\n" + "\n\n\n".join(sections) + "\n"
+
+
+def main(args: list[str] | None = None) -> int:
+    """Generate the loaders module, or check that it is up to date.
+
+    Parameters:
+        args: Command line arguments.
+
+    Returns:
+        Exit code.
+    """
+    parser = argparse.ArgumentParser(prog="gen_decoder")
+    parser.add_argument("--check", action="store_true", help="Only check that the generated module is up to date.")
+    opts = parser.parse_args(args)
+    source = generate()
+    if opts.check:
+        if OUTPUT_PATH.read_text(encoding="utf8") != source:
+            print(f"{OUTPUT_PATH} is outdated, run scripts/gen_decoder.py", file=sys.stderr)
+            return 1
+        return 0
+    OUTPUT_PATH.write_text(source, encoding="utf8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,9 +5,10 @@ Signatures for entire TypeScript programs using TypeDoc.
 
 from __future__ import annotations
 
+from griffe_typedoc._internal.cache import ProjectCache
 from griffe_typedoc._internal.cli import get_parser, main
 from griffe_typedoc._internal.decoder import TypedocDecoder
-from griffe_typedoc._internal.loader import load
+from griffe_typedoc._internal.loader import load, load_async, load_json, load_many
 from griffe_typedoc._internal.logger import LogLevel, get_logger, patch_loggers
 from griffe_typedoc._internal.models import (
     Accessor,
@@ -47,6 +48,10 @@ from griffe_typedoc._internal.models import (
     TypeParameter,
     Variable,
 )
+from griffe_typedoc._internal.snapshot import load_snapshot, save_snapshot
+from griffe_typedoc._internal.sources import SourceCache
+from griffe_typedoc._internal.watcher import ChangeSet, ProjectWatcher
+from griffe_typedoc._internal.worker import TypedocWorker
 
 __all__: list[str] = [
     "Accessor",
@@ -55,6 +60,7 @@ __all__: list[str] = [
     "BlockTagContentKind",
     "BlockTagKind",
     "CallSignature",
+    "ChangeSet",
     "Class",
     "Comment",
     "Constructor",
@@ -73,12 +79,15 @@ __all__: list[str] = [
     "Namespace",
     "Parameter",
     "Project",
+    "ProjectCache",
+    "ProjectWatcher",
     "Property",
     "Reference",
     "Reflection",
     "ReflectionKind",
     "SetSignature",
     "Source",
+    "SourceCache",
     "Target",
     "Type",
     "TypeAlias",
@@ -86,10 +95,16 @@ __all__: list[str] = [
     "TypeLiteral",
     "TypeParameter",
     "TypedocDecoder",
+    "TypedocWorker",
     "Variable",
     "get_logger",
     "get_parser",
     "load",
+    "load_async",
+    "load_json",
+    "load_many",
+    "load_snapshot",
     "main",
     "patch_loggers",
+    "save_snapshot",
 ]
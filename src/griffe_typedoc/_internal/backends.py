@@ -0,0 +1,34 @@
+# This module contains JSON backends, parsing TypeDoc's JSON into dictionaries and lists
+# before the decoder converts them to models.
+
+from __future__ import annotations
+
+import json
+from typing import Any, Callable
+
+
+def _parse_orjson(contents: str | bytes | bytearray) -> Any:
+    import orjson  # noqa: PLC0415
+
+    return orjson.loads(contents)
+
+
+def _parse_msgspec(contents: str | bytes | bytearray) -> Any:
+    import msgspec  # noqa: PLC0415
+
+    return msgspec.json.decode(contents)
+
+
+# Parsers by backend name. Third-party backends are imported on first use.
+_parsers: dict[str, Callable[[str | bytes | bytearray], Any]] = {
+    "json": json.loads,
+    "orjson": _parse_orjson,
+    "msgspec": _parse_msgspec,
+}
+
+
+def _get_parser(backend: str) -> Callable[[str | bytes | bytearray], Any]:
+    try:
+        return _parsers[backend]
+    except KeyError:
+        raise ValueError(f"Unknown JSON backend '{backend}', expected one of: {', '.join(_parsers)}") from None
@@ -0,0 +1,183 @@
+# This module contains an on-disk cache for decoded TypeDoc projects.
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import TYPE_CHECKING
+
+from griffe_typedoc._internal import debug
+from griffe_typedoc._internal.logger import get_logger
+from griffe_typedoc._internal.snapshot import _read_snapshot, _write_snapshot
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from griffe_typedoc._internal.models import Project
+
+_logger = get_logger(__name__)
+
+_LOCKFILES = ("package-lock.json", "npm-shrinkwrap.json", "yarn.lock", "pnpm-lock.yaml", "bun.lockb")
+_SOURCE_SUFFIXES = frozenset((".ts", ".tsx", ".mts", ".cts", ".js", ".jsx", ".mjs", ".cjs", ".json", ".md"))
+# Dependencies and build outputs (including documentation sites) are not TypeDoc inputs.
+_IGNORED_DIRECTORIES = frozenset(("node_modules", "dist", "build", "out", "site"))
+# Configuration files that packages of a monorepo usually extend from a parent directory.
+_PARENT_CONFIG_PATTERNS = ("tsconfig*.json", "typedoc.json", "typedoc.config.*", "package.json")
+_CACHE_SUFFIX = ".snapshot"
+
+
+def _default_cache_directory() -> Path:
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home, "griffe-typedoc")
+
+
+def _touch(path: Path) -> None:
+    # File timestamps use a coarse clock, explicit times keep the eviction order accurate.
+    now = time.time_ns()
+    os.utime(path, ns=(now, now))
+
+
+def _iter_source_files(directory: Path) -> Iterator[Path]:
+    for root, dirs, files in os.walk(directory):
+        # Prune dependencies and hidden directories (`.git`, `.cache`, etc.) in place.
+        dirs[:] = sorted(name for name in dirs if name not in _IGNORED_DIRECTORIES and not name.startswith("."))
+        for name in sorted(files):
+            if os.path.splitext(name)[1] in _SOURCE_SUFFIXES:
+                yield Path(root, name)
+
+
+def _iter_lockfiles(directory: Path) -> Iterator[Path]:
+    # Lockfiles of monorepos usually live in a parent directory.
+    for parent in (directory, *directory.parents):
+        for name in _LOCKFILES:
+            if (lockfile := parent / name).is_file():
+                yield lockfile
+
+
+def _iter_parent_configs(directory: Path) -> Iterator[Path]:
+    # Shared TypeScript and TypeDoc configurations (see their `extends` options) live in parent directories.
+    # Files of the working directory itself are already sources.
+    for parent in directory.parents:
+        paths = {path for pattern in _PARENT_CONFIG_PATTERNS for path in parent.glob(pattern)}
+        yield from sorted(path for path in paths if path.is_file())
+
+
+class ProjectCache:
+    """On-disk cache of decoded projects, keyed on TypeDoc inputs.
+
+    Keys are fingerprints of the TypeDoc command, the working directory's
+    sources and configuration files, the TypeScript and TypeDoc configuration files
+    of parent directories, and the package lockfiles.
+    When the cache exceeds its maximum size, least recently used entries are evicted.
+    """
+
+    def __init__(self, directory: str | Path | None = None, max_size: int = 512 * 1024 * 1024) -> None:
+        """Initialize the cache.
+
+        Parameters:
+            directory: Where to store cached projects. Default: `$XDG_CACHE_HOME/griffe-typedoc`.
+            max_size: Maximum total size of the cache, in bytes.
+        """
+        self.directory: Path = Path(directory) if directory else _default_cache_directory()
+        """The cache directory."""
+        self.max_size: int = max_size
+        """Maximum total size of the cache, in bytes."""
+
+    def fingerprint(self, typedoc_command: str | list[str], working_directory: str = ".") -> str:
+        """Compute the cache key for a TypeDoc invocation.
+
+        Parameters:
+            typedoc_command: Name/path of the `typedoc` executable, or a command as list.
+            working_directory: Where the command is executed.
+
+        Returns:
+            A hexadecimal digest of the TypeDoc inputs.
+        """
+        directory = Path(working_directory).resolve()
+        digest = hashlib.sha256()
+        digest.update(json.dumps([debug._get_version(), typedoc_command, str(directory)]).encode())
+        for path in (*_iter_lockfiles(directory), *_iter_parent_configs(directory), *_iter_source_files(directory)):
+            digest.update(str(path).encode())
+            digest.update(b"\0")
+            digest.update(path.read_bytes())
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Project | None:
+        """Return the project cached under the given key, if any.
+
+        Parameters:
+            key: A cache key, see [`fingerprint`][griffe_typedoc.ProjectCache.fingerprint].
+
+        Returns:
+            A project, or none.
+        """
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        try:
+            project = _read_snapshot(data)
+        except Exception:  # noqa: BLE001
+            _logger.debug(f"Discarding unreadable cache entry {path}")
+            path.unlink(missing_ok=True)
+            return None
+        # Mark entry as recently used.
+        _touch(path)
+        return project
+
+    def set(self, key: str, project: Project) -> None:
+        """Store a project under the given key.
+
+        Parameters:
+            key: A cache key, see [`fingerprint`][griffe_typedoc.ProjectCache.fingerprint].
+            project: The project to store.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with NamedTemporaryFile("wb", dir=self.directory, suffix=".tmp", delete=False) as tmpfile:
+            _write_snapshot(project, tmpfile)
+        path = Path(tmpfile.name).replace(self._path(key))
+        _touch(path)
+        self._evict()
+
+    def invalidate(self, key: str | None = None) -> None:
+        """Remove an entry from the cache, or all entries.
+
+        Parameters:
+            key: The key of the entry to remove. If not provided, the whole cache is cleared.
+        """
+        if key is not None:
+            self._path(key).unlink(missing_ok=True)
+            return
+        for path in self._entries():
+            path.unlink(missing_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{_CACHE_SUFFIX}"
+
+    def _entries(self) -> list[Path]:
+        if not self.directory.is_dir():
+            return []
+        return list(self.directory.glob(f"*{_CACHE_SUFFIX}"))
+
+    def _evict(self) -> None:
+        entries = []
+        for path in self._entries():
+            # Other threads or processes may have evicted the entry in the meantime.
+            try:
+                entries.append((path, path.stat()))
+            except FileNotFoundError:
+                continue
+        total_size = sum(stat.st_size for _, stat in entries)
+        # Remove least recently used entries first.
+        for path, stat in sorted(entries, key=lambda entry: entry[1].st_mtime_ns):
+            if total_size <= self.max_size:
+                break
+            _logger.debug(f"Evicting cache entry {path}")
+            path.unlink(missing_ok=True)
+            total_size -= stat.st_size
@@ -16,6 +16,7 @@ import sys
 from typing import Any
 
 from griffe_typedoc._internal import debug
+from griffe_typedoc._internal.loader import load_json
 
 
 class _DebugInfo(argparse.Action):
@@ -36,6 +37,13 @@ def get_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(prog="griffe-typedoc")
     parser.add_argument("-V", "--version", action="version", version=f"%(prog)s {debug._get_version()}")
     parser.add_argument("--debug-info", action=_DebugInfo, help="Print debug information.")
+    parser.add_argument(
+        "-j",
+        "--json",
+        metavar="FILE",
+        help="Load API data from a JSON file generated by TypeDoc, without running TypeDoc.",
+    )
+    parser.add_argument("--mmap", action="store_true", help="Memory-map the JSON file instead of reading it.")
     return parser
 
 
@@ -52,5 +60,10 @@ def main(args: list[str] | None = None) -> int:
     """
     parser = get_parser()
     opts = parser.parse_args(args=args)
+    if opts.json:
+        project = load_json(opts.json, memory_map=opts.mmap)
+        version = f" {project.package_version}" if project.package_version else ""
+        print(f"{project.name}{version} ({len(project.symbol_id_map)} symbols)")
+        return 0
     print(opts)
     return 0
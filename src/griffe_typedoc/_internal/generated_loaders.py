@@ -0,0 +1,855 @@
+# This module contains loaders converting TypeDoc's JSON objects to models.
+# It is generated from `scripts/typedoc_schema.json` by `scripts/gen_decoder.py`: do not edit it by hand.
+# Objects are created without calling `__init__`: every field is assigned explicitly,
+# reading camelCase keys directly instead of translating them and splatting keyword arguments.
+
+from __future__ import annotations
+
+import sys
+from functools import partial
+from typing import Any, Callable
+
+from griffe_typedoc._internal.models import (
+    Accessor,
+    BlockTag,
+    BlockTagContent,
+    BlockTagContentKind,
+    BlockTagKind,
+    CallSignature,
+    Class,
+    Comment,
+    Constructor,
+    ConstructorSignature,
+    Enum,
+    EnumMember,
+    FileRegistry,
+    Function,
+    GetSignature,
+    Group,
+    IndexSignature,
+    Interface,
+    Method,
+    Module,
+    Namespace,
+    Parameter,
+    Project,
+    Property,
+    Reference,
+    ReflectionKind,
+    SetSignature,
+    Source,
+    Target,
+    Type,
+    TypeAlias,
+    TypeKind,
+    TypeLiteral,
+    TypeParameter,
+    Variable,
+    _name_slots,
+    _parent_slots,
+)
+from griffe_typedoc._internal.sources import SourceCache
+
+# Underlying slots of each reflection class, whose wrappers clear memoized values.
+_project_name_slot = _name_slots[Project]
+_project_parent_slot = _parent_slots[Project]
+_module_name_slot = _name_slots[Module]
+_module_parent_slot = _parent_slots[Module]
+_namespace_name_slot = _name_slots[Namespace]
+_namespace_parent_slot = _parent_slots[Namespace]
+_enum_name_slot = _name_slots[Enum]
+_enum_parent_slot = _parent_slots[Enum]
+_enum_member_name_slot = _name_slots[EnumMember]
+_enum_member_parent_slot = _parent_slots[EnumMember]
+_variable_name_slot = _name_slots[Variable]
+_variable_parent_slot = _parent_slots[Variable]
+_function_name_slot = _name_slots[Function]
+_function_parent_slot = _parent_slots[Function]
+_class_name_slot = _name_slots[Class]
+_class_parent_slot = _parent_slots[Class]
+_interface_name_slot = _name_slots[Interface]
+_interface_parent_slot = _parent_slots[Interface]
+_constructor_name_slot = _name_slots[Constructor]
+_constructor_parent_slot = _parent_slots[Constructor]
+_property_name_slot = _name_slots[Property]
+_property_parent_slot = _parent_slots[Property]
+_method_name_slot = _name_slots[Method]
+_method_parent_slot = _parent_slots[Method]
+_call_signature_name_slot = _name_slots[CallSignature]
+_call_signature_parent_slot = _parent_slots[CallSignature]
+_index_signature_name_slot = _name_slots[IndexSignature]
+_index_signature_parent_slot = _parent_slots[IndexSignature]
+_constructor_signature_name_slot = _name_slots[ConstructorSignature]
+_constructor_signature_parent_slot = _parent_slots[ConstructorSignature]
+_parameter_name_slot = _name_slots[Parameter]
+_parameter_parent_slot = _parent_slots[Parameter]
+_type_literal_name_slot = _name_slots[TypeLiteral]
+_type_literal_parent_slot = _parent_slots[TypeLiteral]
+_type_parameter_name_slot = _name_slots[TypeParameter]
+_type_parameter_parent_slot = _parent_slots[TypeParameter]
+_accessor_name_slot = _name_slots[Accessor]
+_accessor_parent_slot = _parent_slots[Accessor]
+_get_signature_name_slot = _name_slots[GetSignature]
+_get_signature_parent_slot = _parent_slots[GetSignature]
+_set_signature_name_slot = _name_slots[SetSignature]
+_set_signature_parent_slot = _parent_slots[SetSignature]
+_type_alias_name_slot = _name_slots[TypeAlias]
+_type_alias_parent_slot = _parent_slots[TypeAlias]
+_reference_name_slot = _name_slots[Reference]
+_reference_parent_slot = _parent_slots[Reference]
+
+
+def _load_project(obj_dict: dict[str, Any], symbol_id_map: dict[int, Any]) -> Project:
+    get = obj_dict.get
+    obj = Project.__new__(Project)
+    obj._path = None
+    obj._root = None
+    obj._root_module = None
+    obj.project = None
+    obj._lazy = None
+    obj._resolved_groups = None
+    obj.id = obj_dict["id"]
+    _project_name_slot.__set__(obj, obj_dict["name"])
+    obj.variant = sys.intern(obj_dict["variant"])
+    obj.comment = get("comment")
+    obj.children = get("children") or []
+    obj.flags = get("flags") or {}
+    obj.groups = get("groups") or []
+    obj.sources = get("sources") or []
+    _project_parent_slot.__set__(obj, None)
+    obj.type = get("type")
+    obj.package_name = obj_dict["packageName"]
+    obj.readme = get("readme")
+    obj.symbol_id_map = symbol_id_map
+    obj.package_version = get("packageVersion")
+    obj.files = get("files")
+    obj.source_cache = SourceCache()
+    obj._path_index = None
+    obj._name_index = None
+    obj._references = None
+    symbol_id_map[obj.id] = obj
+    return obj
+
+
+def _load_module(obj_dict: dict[str, Any], symbol_id_map: dict[int, Any]) -> Module:
+    get = obj_dict.get
+    obj = Module.__new__(Module)
+    obj._path = None
+    obj._root = None
+    obj._root_module = None
+    obj.project = None
+    obj._lazy = None
+    obj._resolved_groups = None
+    obj.id = obj_dict["id"]
+    _module_name_slot.__set__(obj, obj_dict["name"])
+    obj.variant = sys.intern(obj_dict["variant"])
+    obj.comment = get("comment")
+    obj.children = get("children") or []
+    obj.flags = get("flags") or {}
+    obj.groups = get("groups") or []
+    obj.sources = get("sources") or []
+    _module_parent_slot.__set__(obj, None)
+    obj.type = get("type")
+    obj.package_version = get("packageVersion")
+    obj.readme = get("readme")
+    obj._exports = None
+    symbol_id_map[obj.id] = obj
+    return obj
+
+
+def _load_namespace(obj_dict: dict[str, Any], symbol_id_map: dict[int, Any]) -> Namespace:
+    get = obj_dict.get
+    obj = Namespace.__new__(Namespace)
+    obj._path = None
+    obj._root = None
+    obj._root_module = None
+    obj.project = None
+    obj._lazy = None
+    obj._resolved_groups = None
+    obj.id = obj_dict["id"]
+    _namespace_name_slot.__set__(obj, obj_dict["name"])
+    obj.variant = sys.intern(obj_dict["variant"])
+    obj.comment = get("comment")
+    obj.children = get("children") or []
+    obj.flags = get("flags") or {}
+    obj.groups = get("groups") or []
+    obj.sources = get("sources") or []
+    _namespace_parent_slot.__set__(obj, None)
+    obj.type = get("type")
+    symbol_id_map[obj.id] = obj
+    return obj
+
+
+def _load_enum(obj_dict: dict[str, Any], symbol_id_map: dict[int, Any]) -> Enum:
+    get = obj_dict.get
+    obj = Enum.__new__(Enum)
+    obj._path = None
+    obj._root = None
+    obj._root_module = None
+    obj.project = None
+    obj._lazy = None
+    obj._resolved_groups = None
+    obj.id = obj_dict["id"]
+    _enum_name_slot.__set__(obj, obj_dict["name"])
+    obj.variant = sys.intern(obj_dict["variant"])
+    obj.comment = get("comment")
+    obj.children = get("children") or []
+    obj.flags = get("flags") or {}
+    obj.groups = get("groups") or []
+    obj.sources = get("sources") or []
+    _enum_parent_slot.__set__(obj, None)
+    obj.type = get("type")
+    symbol_id_map[obj.id] = obj
+    return obj
+
+
+def _load_enum_member(obj_dict: dict[str, Any], symbol_id_map: dict[int, Any]) -> EnumMember:
+    get = obj_dict.get
+    obj = EnumMember.__new__(EnumMember)
+    obj._path = None
+    obj._root = None
+    obj._root_module = None
+    obj.project = None
+    obj._lazy = None
+    obj._resolved_groups = None
+    obj.id = obj_dict["id"]
+    _enum_member_name_slot.__set__(obj, obj_dict["name"])
+    obj.variant = sys.intern(obj_dict["variant"])
+    obj.comment = get("comment")
+    obj.children = get("children") or []
+    obj.flags = get("flags") or {}
+    obj.groups = get("groups") or []
+    obj.sources = get("sources") or []
+    _enum_member_parent_slot.__set__(obj, None)
+    obj.type = get("type")
+    symbol_id_map[obj.id] = obj
+    return obj
+
+
+def _load_variable(obj_dict: dict[str, Any], symbol_id_map: dict[int, Any]) -> Variable:
+    get = obj_dict.get
+    obj = Variable.__new__(Variable)
+    obj._path = None
+    obj._root = None
+    obj._root_module = None
+    obj.project = None
+    obj._lazy = None
+    obj._resolved_groups = None
+    obj.id = obj_dict["id"]
+    _variable_name_slot.__set__(obj, obj_dict["name"])
+    obj.variant = sys.intern(obj_dict["variant"])
+    obj.comment = get("comment")
+    obj.children = get("children") or []
+    obj.flags = get("flags") or {}
+    obj.groups = get("groups") or []
+    obj.sources = get("sources") or []
+    _variable_parent_slot.__set__(obj, None)
+    obj.type = obj_dict["type"]
+    obj.default_value = get("defaultValue")
+    symbol_id_map[obj.id] = obj
+    return obj
+
+
+def _load_function(obj_dict: dict[str, Any], symbol_id_map: dict[int, Any]) -> Function:
+    get = obj_dict.get
+    obj = Function.__new__(Function)
+    obj._path = None
+    obj._root = None
+    obj._root_module = None
+    obj.project = None
+    obj._lazy = None
+    obj._resolved_groups = None
+    obj.id = obj_dict["id"]
+    _function_name_slot.__set__(obj, obj_dict["name"])
+    obj.variant = sys.intern(obj_dict["variant"])
+    obj.comment = get("comment")
+    obj.children = get("children") or []
+    obj.flags = get("flags") or {}
+    obj.groups = get("groups") or []
+    obj.sources = get("sources") or []
+    _function_parent_slot.__set__(obj, None)
+    obj.type = get("type")
+    obj.signatures = obj_dict["signatures"]
+    obj._exports = None
+    symbol_id_map[obj.id] = obj
+    return obj
+
+
+def _load_class(obj_dict: dict[str, Any], symbol_id_map: dict[int, Any]) -> Class:
+    get = obj_dict.get
+    obj = Class.__new__(Class)
+    obj._path = None
+    obj._root = None
+    obj._root_module = None
+    obj.project = None
+    obj._lazy = None
+    obj._resolved_groups = None
+    obj.id = obj_dict["id"]
+    _class_name_slot.__set__(obj, obj_dict["name"])
+    obj.variant = sys.intern(obj_dict["variant"])
+    obj.comment = get("comment")
+    obj.children = get("children") or []
+    obj.flags = get("flags") or {}
+    obj.groups = get("groups") or []
+    obj.sources = get("sources") or []
+    _class_parent_slot.__set__(obj, None)
+    obj.type = get("type")
+    obj.extended_types = get("extendedTypes")
+    obj.extended_by = get("extendedBy")
+    obj.implemented_types = get("implementedTypes")
+    obj.index_signatures = get("indexSignatures")
+    obj.type_parameters = get("typeParameters")
+    symbol_id_map[obj.id] = obj
+    return obj
+
+
+def _load_interface(obj_dict: dict[str, Any], symbol_id_map: dict[int, Any]) -> Interface:
+    get = obj_dict.get
+    obj = Interface.__new__(Interface)
+    obj._path = None
+    obj._root = None
+    obj._root_module = None
+    obj.project = None
+    obj._lazy = None
+    obj._resolved_groups = None
+    obj.id = obj_dict["id"]
+    _interface_name_slot.__set__(obj, obj_dict["name"])
+    obj.variant = sys.intern(obj_dict["variant"])
+    obj.comment = get("comment")
+    obj.children = get("children") or []
+    obj.flags = get("flags") or {}
+    obj.groups = get("groups") or []
+    obj.sources = get("sources") or []
+    _interface_parent_slot.__set__(obj, None)
+    obj.type = get("type")
+    obj.extended_types = get("extendedTypes")
+    obj.extended_by = get("extendedBy")
+    obj.type_parameters = get("typeParameters")
+    obj.index_signature = get("indexSignature")
+    obj.implemented_by = get("implementedBy")
+    obj.index_signatures = get("indexSignatures")
+    obj.signatures = get("signatures")
+    symbol_id_map[obj.id] = obj
+    return obj
+
+
+def _load_constructor(obj_dict: dict[str, Any], symbol_id_map: dict[int, Any]) -> Constructor:
+    get = obj_dict.get
+    obj = Constructor.__new__(Constructor)
+    obj._path = None
+    obj._root = None
+    obj._root_module = None
+    obj.project = None
+    obj._lazy = None
+    obj._resolved_groups = None
+    obj.id = obj_dict["id"]
+    _constructor_name_slot.__set__(obj, obj_dict["name"])
+    obj.variant = sys.intern(obj_dict["variant"])
+    obj.comment = get("comment")
+    obj.children = get("children") or []
+    obj.flags = get("flags") or {}
+    obj.groups = get("groups") or []
+    obj.sources = get("sources") or []
+    _constructor_parent_slot.__set__(obj, None)
+    obj.type = get("type")
+    obj.signatures = get("signatures")
+    obj.overwrites = get("overwrites")
+    obj.inherited_from = get("inheritedFrom")
+    symbol_id_map[obj.id] = obj
+    return obj
+
+
+def _load_property(obj_dict: dict[str, Any], symbol_id_map: dict[int, Any]) -> Property:
+    get = obj_dict.get
+    obj = Property.__new__(Property)
+    obj._path = None
+    obj._root = None
+    obj._root_module = None
+    obj.project = None
+    obj._lazy = None
+    obj._resolved_groups = None
+    obj.id = obj_dict["id"]
+    _property_name_slot.__set__(obj, obj_dict["name"])
+    obj.variant = sys.intern(obj_dict["variant"])
+    obj.comment = get("comment")
+    obj.children = get("children") or []
+    obj.flags = get("flags") or {}
+    obj.groups = get("groups") or []
+    obj.sources = get("sources") or []
+    _property_parent_slot.__set__(obj, None)
+    obj.type = obj_dict["type"]
+    obj.inherited_from = get("inheritedFrom")
+    obj.overwrites = get("overwrites")
+    obj.default_value = get("defaultValue")
+    obj.implementation_of = get("implementationOf")
+    symbol_id_map[obj.id] = obj
+    return obj
+
+
+def _load_method(obj_dict: dict[str, Any], symbol_id_map: dict[int, Any]) -> Method:
+    get = obj_dict.get
+    obj = Method.__new__(Method)
+    obj._path = None
+    obj._root = None
+    obj._root_module = None
+    obj.project = None
+    obj._lazy = None
+    obj._resolved_groups = None
+    obj.id = obj_dict["id"]
+    _method_name_slot.__set__(obj, obj_dict["name"])
+    obj.variant = sys.intern(obj_dict["variant"])
+    obj.comment = get("comment")
+    obj.children = get("children") or []
+    obj.flags = get("flags") or {}
+    obj.groups = get("groups") or []
+    obj.sources = get("sources") or []
+    _method_parent_slot.__set__(obj, None)
+    obj.type = get("type")
+    obj.signatures = obj_dict["signatures"]
+    obj.overwrites = get("overwrites")
+    obj.implementation_of = get("implementationOf")
+    obj.inherited_from = get("inheritedFrom")
+    symbol_id_map[obj.id] = obj
+    return obj
+
+
+def _load_call_signature(obj_dict: dict[str, Any], symbol_id_map: dict[int, Any]) -> CallSignature:
+    get = obj_dict.get
+    obj = CallSignature.__new__(CallSignature)
+    obj._path = None
+    obj._root = None
+    obj._root_module = None
+    obj.project = None
+    obj._lazy = None
+    obj._resolved_groups = None
+    obj.id = obj_dict["id"]
+    _call_signature_name_slot.__set__(obj, obj_dict["name"])
+    obj.variant = sys.intern(obj_dict["variant"])
+    obj.comment = get("comment")
+    obj.children = get("children") or []
+    obj.flags = get("flags") or {}
+    obj.groups = get("groups") or []
+    obj.sources = get("sources") or []
+    _call_signature_parent_slot.__set__(obj, None)
+    obj.type = obj_dict["type"]
+    obj.parameters = get("parameters")
+    obj.type_parameters = get("typeParameters")
+    obj.overwrites = get("overwrites")
+    obj.implementation_of = get("implementationOf")
+    obj.inherited_from = get("inheritedFrom")
+    symbol_id_map[obj.id] = obj
+    return obj
+
+
+def _load_index_signature(obj_dict: dict[str, Any], symbol_id_map: dict[int, Any]) -> IndexSignature:
+    get = obj_dict.get
+    obj = IndexSignature.__new__(IndexSignature)
+    obj._path = None
+    obj._root = None
+    obj._root_module = None
+    obj.project = None
+    obj._lazy = None
+    obj._resolved_groups = None
+    obj.id = obj_dict["id"]
+    _index_signature_name_slot.__set__(obj, obj_dict["name"])
+    obj.variant = sys.intern(obj_dict["variant"])
+    obj.comment = get("comment")
+    obj.children = get("children") or []
+    obj.flags = get("flags") or {}
+    obj.groups = get("groups") or []
+    obj.sources = get("sources") or []
+    _index_signature_parent_slot.__set__(obj, None)
+    obj.type = obj_dict["type"]
+    obj.parameters = get("parameters")
+    symbol_id_map[obj.id] = obj
+    return obj
+
+
+def _load_constructor_signature(obj_dict: dict[str, Any], symbol_id_map: dict[int, Any]) -> ConstructorSignature:
+    get = obj_dict.get
+    obj = ConstructorSignature.__new__(ConstructorSignature)
+    obj._path = None
+    obj._root = None
+    obj._root_module = None
+    obj.project = None
+    obj._lazy = None
+    obj._resolved_groups = None
+    obj.id = obj_dict["id"]
+    _constructor_signature_name_slot.__set__(obj, obj_dict["name"])
+    obj.variant = sys.intern(obj_dict["variant"])
+    obj.comment = get("comment")
+    obj.children = get("children") or []
+    obj.flags = get("flags") or {}
+    obj.groups = get("groups") or []
+    obj.sources = get("sources") or []
+    _constructor_signature_parent_slot.__set__(obj, None)
+    obj.type = get("type")
+    obj.parameters = get("parameters")
+    obj.overwrites = get("overwrites")
+    obj.inherited_from = get("inheritedFrom")
+    obj.type_parameters = get("typeParameters")
+    symbol_id_map[obj.id] = obj
+    return obj
+
+
+def _load_parameter(obj_dict: dict[str, Any], symbol_id_map: dict[int, Any]) -> Parameter:
+    get = obj_dict.get
+    obj = Parameter.__new__(Parameter)
+    obj._path = None
+    obj._root = None
+    obj._root_module = None
+    obj.project = None
+    obj._lazy = None
+    obj._resolved_groups = None
+    obj.id = obj_dict["id"]
+    _parameter_name_slot.__set__(obj, obj_dict["name"])
+    obj.variant = sys.intern(obj_dict["variant"])
+    obj.comment = get("comment")
+    obj.children = get("children") or []
+    obj.flags = get("flags") or {}
+    obj.groups = get("groups") or []
+    obj.sources = get("sources") or []
+    _parameter_parent_slot.__set__(obj, None)
+    obj.type = get("type")
+    obj.default_value = get("defaultValue")
+    symbol_id_map[obj.id] = obj
+    return obj
+
+
+def _load_type_literal(obj_dict: dict[str, Any], symbol_id_map: dict[int, Any]) -> TypeLiteral:
+    get = obj_dict.get
+    obj = TypeLiteral.__new__(TypeLiteral)
+    obj._path = None
+    obj._root = None
+    obj._root_module = None
+    obj.project = None
+    obj._lazy = None
+    obj._resolved_groups = None
+    obj.id = obj_dict["id"]
+    _type_literal_name_slot.__set__(obj, obj_dict["name"])
+    obj.variant = sys.intern(obj_dict["variant"])
+    obj.comment = get("comment")
+    obj.children = get("children") or []
+    obj.flags = get("flags") or {}
+    obj.groups = get("groups") or []
+    obj.sources = get("sources") or []
+    _type_literal_parent_slot.__set__(obj, None)
+    obj.type = get("type")
+    obj.signatures = get("signatures")
+    obj.index_signatures = get("indexSignatures")
+    symbol_id_map[obj.id] = obj
+    return obj
+
+
+def _load_type_parameter(obj_dict: dict[str, Any], symbol_id_map: dict[int, Any]) -> TypeParameter:
+    get = obj_dict.get
+    obj = TypeParameter.__new__(TypeParameter)
+    obj._path = None
+    obj._root = None
+    obj._root_module = None
+    obj.project = None
+    obj._lazy = None
+    obj._resolved_groups = None
+    obj.id = obj_dict["id"]
+    _type_parameter_name_slot.__set__(obj, obj_dict["name"])
+    obj.variant = sys.intern(obj_dict["variant"])
+    obj.comment = get("comment")
+    obj.children = get("children") or []
+    obj.flags = get("flags") or {}
+    obj.groups = get("groups") or []
+    obj.sources = get("sources") or []
+    _type_parameter_parent_slot.__set__(obj, None)
+    obj.type = get("type")
+    obj.default = get("default")
+    symbol_id_map[obj.id] = obj
+    return obj
+
+
+def _load_accessor(obj_dict: dict[str, Any], symbol_id_map: dict[int, Any]) -> Accessor:
+    get = obj_dict.get
+    obj = Accessor.__new__(Accessor)
+    obj._path = None
+    obj._root = None
+    obj._root_module = None
+    obj.project = None
+    obj._lazy = None
+    obj._resolved_groups = None
+    obj.id = obj_dict["id"]
+    _accessor_name_slot.__set__(obj, obj_dict["name"])
+    obj.variant = sys.intern(obj_dict["variant"])
+    obj.comment = get("comment")
+    obj.children = get("children") or []
+    obj.flags = get("flags") or {}
+    obj.groups = get("groups") or []
+    obj.sources = get("sources") or []
+    _accessor_parent_slot.__set__(obj, None)
+    obj.type = get("type")
+    obj.get_signature = get("getSignature")
+    obj.set_signature = get("setSignature")
+    obj.overwrites = get("overwrites")
+    obj.implementation_of = get("implementationOf")
+    obj.inherited_from = get("inheritedFrom")
+    symbol_id_map[obj.id] = obj
+    return obj
+
+
+def _load_get_signature(obj_dict: dict[str, Any], symbol_id_map: dict[int, Any]) -> GetSignature:
+    get = obj_dict.get
+    obj = GetSignature.__new__(GetSignature)
+    obj._path = None
+    obj._root = None
+    obj._root_module = None
+    obj.project = None
+    obj._lazy = None
+    obj._resolved_groups = None
+    obj.id = obj_dict["id"]
+    _get_signature_name_slot.__set__(obj, obj_dict["name"])
+    obj.variant = sys.intern(obj_dict["variant"])
+    obj.comment = get("comment")
+    obj.children = get("children") or []
+    obj.flags = get("flags") or {}
+    obj.groups = get("groups") or []
+    obj.sources = get("sources") or []
+    _get_signature_parent_slot.__set__(obj, None)
+    obj.type = get("type")
+    obj.overwrites = get("overwrites")
+    obj.implementation_of = get("implementationOf")
+    obj.inherited_from = get("inheritedFrom")
+    symbol_id_map[obj.id] = obj
+    return obj
+
+
+def _load_set_signature(obj_dict: dict[str, Any], symbol_id_map: dict[int, Any]) -> SetSignature:
+    get = obj_dict.get
+    obj = SetSignature.__new__(SetSignature)
+    obj._path = None
+    obj._root = None
+    obj._root_module = None
+    obj.project = None
+    obj._lazy = None
+    obj._resolved_groups = None
+    obj.id = obj_dict["id"]
+    _set_signature_name_slot.__set__(obj, obj_dict["name"])
+    obj.variant = sys.intern(obj_dict["variant"])
+    obj.comment = get("comment")
+    obj.children = get("children") or []
+    obj.flags = get("flags") or {}
+    obj.groups = get("groups") or []
+    obj.sources = get("sources") or []
+    _set_signature_parent_slot.__set__(obj, None)
+    obj.type = get("type")
+    obj.parameters = get("parameters")
+    obj.overwrites = get("overwrites")
+    obj.implementation_of = get("implementationOf")
+    obj.inherited_from = get("inheritedFrom")
+    symbol_id_map[obj.id] = obj
+    return obj
+
+
+def _load_type_alias(obj_dict: dict[str, Any], symbol_id_map: dict[int, Any]) -> TypeAlias:
+    get = obj_dict.get
+    obj = TypeAlias.__new__(TypeAlias)
+    obj._path = None
+    obj._root = None
+    obj._root_module = None
+    obj.project = None
+    obj._lazy = None
+    obj._resolved_groups = None
+    obj.id = obj_dict["id"]
+    _type_alias_name_slot.__set__(obj, obj_dict["name"])
+    obj.variant = sys.intern(obj_dict["variant"])
+    obj.comment = get("comment")
+    obj.children = get("children") or []
+    obj.flags = get("flags") or {}
+    obj.groups = get("groups") or []
+    obj.sources = get("sources") or []
+    _type_alias_parent_slot.__set__(obj, None)
+    obj.type = obj_dict["type"]
+    obj.type_parameters = get("typeParameters")
+    obj.implemented_by = get("implementedBy")
+    symbol_id_map[obj.id] = obj
+    return obj
+
+
+def _load_reference(obj_dict: dict[str, Any], symbol_id_map: dict[int, Any]) -> Reference:
+    get = obj_dict.get
+    obj = Reference.__new__(Reference)
+    obj._path = None
+    obj._root = None
+    obj._root_module = None
+    obj.project = None
+    obj._lazy = None
+    obj._resolved_groups = None
+    obj.id = obj_dict["id"]
+    _reference_name_slot.__set__(obj, obj_dict["name"])
+    obj.variant = sys.intern(obj_dict["variant"])
+    obj.comment = get("comment")
+    obj.children = get("children") or []
+    obj.flags = get("flags") or {}
+    obj.groups = get("groups") or []
+    obj.sources = get("sources") or []
+    _reference_parent_slot.__set__(obj, None)
+    obj.type = get("type")
+    obj.target = obj_dict["target"]
+    symbol_id_map[obj.id] = obj
+    return obj
+
+
+def _load_block_tag(kind: BlockTagKind, obj_dict: dict[str, Any], _symbol_id_map: dict[int, Any]) -> BlockTag:
+    obj = BlockTag.__new__(BlockTag)
+    obj.kind = kind
+    obj.content = obj_dict["content"]
+    return obj
+
+
+def _load_block_tag_content(
+    kind: BlockTagContentKind,
+    obj_dict: dict[str, Any],
+    _symbol_id_map: dict[int, Any],
+) -> BlockTagContent:
+    get = obj_dict.get
+    obj = BlockTagContent.__new__(BlockTagContent)
+    obj.kind = kind
+    obj.text = obj_dict["text"]
+    obj.target = get("target")
+    obj.ts_link_text = get("tsLinkText")
+    return obj
+
+
+def _load_comment(obj_dict: dict[str, Any], _symbol_id_map: dict[int, Any]) -> Comment:
+    get = obj_dict.get
+    obj = Comment.__new__(Comment)
+    obj.summary = obj_dict["summary"]
+    obj.tags = get("tags")
+    obj.block_tags = get("blockTags")
+    return obj
+
+
+def _load_source(obj_dict: dict[str, Any], _symbol_id_map: dict[int, Any]) -> Source:
+    get = obj_dict.get
+    obj = Source.__new__(Source)
+    obj.file_name = sys.intern(obj_dict["fileName"])
+    obj.line = obj_dict["line"]
+    obj.character = obj_dict["character"]
+    obj.url = get("url")
+    obj.parent = None
+    return obj
+
+
+def _load_type(obj_dict: dict[str, Any], _symbol_id_map: dict[int, Any]) -> Type:
+    get = obj_dict.get
+    obj = Type.__new__(Type)
+    obj.type = TypeKind(obj_dict["type"])
+    obj.name = sys.intern(value) if (value := get("name")) is not None else None
+    obj.target = get("target")
+    obj.package = sys.intern(value) if (value := get("package")) is not None else None
+    obj.type_arguments = get("typeArguments")
+    obj.qualified_name = sys.intern(value) if (value := get("qualifiedName")) is not None else None
+    obj.element_type = get("elementType")
+    obj.refers_to_type_parameter = get("refersToTypeParameter")
+    obj.value = get("value")
+    obj.types = get("types")
+    obj.declaration = get("declaration")
+    obj.elements = get("elements")
+    obj.prefer_values = get("preferValues")
+    obj.query_type = get("queryType")
+    obj.operator = get("operator")
+    obj.parameter = get("parameter")
+    obj.parameter_type = get("parameterType")
+    obj.template_type = get("templateType")
+    return obj
+
+
+def _load_target(obj_dict: dict[str, Any], _symbol_id_map: dict[int, Any]) -> Target:
+    obj = Target.__new__(Target)
+    obj.source_file_name = sys.intern(obj_dict["sourceFileName"])
+    obj.qualified_name = sys.intern(obj_dict["qualifiedName"])
+    return obj
+
+
+def _load_group(obj_dict: dict[str, Any], _symbol_id_map: dict[int, Any]) -> Group:
+    obj = Group.__new__(Group)
+    obj.title = obj_dict["title"]
+    obj.children = obj_dict["children"]
+    return obj
+
+
+def _load_file_registry(obj_dict: dict[str, Any], _symbol_id_map: dict[int, Any]) -> FileRegistry:
+    obj = FileRegistry.__new__(FileRegistry)
+    obj.entries = obj_dict["entries"]
+    obj.reflections = obj_dict["reflections"]
+    obj._reverse_reflections = None
+    return obj
+
+
+# Loaders of reflections, block tags and block tag contents, by kind.
+_loader_map: dict[
+    ReflectionKind | BlockTagKind | BlockTagContentKind,
+    Callable[[dict[str, Any], dict[int, Any]], Any],
+] = {
+    ReflectionKind.PROJECT: _load_project,
+    ReflectionKind.MODULE: _load_module,
+    ReflectionKind.NAMESPACE: _load_namespace,
+    ReflectionKind.ENUM: _load_enum,
+    ReflectionKind.ENUM_MEMBER: _load_enum_member,
+    ReflectionKind.VARIABLE: _load_variable,
+    ReflectionKind.FUNCTION: _load_function,
+    ReflectionKind.CLASS: _load_class,
+    ReflectionKind.INTERFACE: _load_interface,
+    ReflectionKind.CONSTRUCTOR: _load_constructor,
+    ReflectionKind.PROPERTY: _load_property,
+    ReflectionKind.METHOD: _load_method,
+    ReflectionKind.CALL_SIGNATURE: _load_call_signature,
+    ReflectionKind.INDEX_SIGNATURE: _load_index_signature,
+    ReflectionKind.CONSTRUCTOR_SIGNATURE: _load_constructor_signature,
+    ReflectionKind.PARAMETER: _load_parameter,
+    ReflectionKind.TYPE_LITERAL: _load_type_literal,
+    ReflectionKind.TYPE_PARAMETER: _load_type_parameter,
+    ReflectionKind.ACCESSOR: _load_accessor,
+    ReflectionKind.GET_SIGNATURE: _load_get_signature,
+    ReflectionKind.SET_SIGNATURE: _load_set_signature,
+    ReflectionKind.TYPE_ALIAS: _load_type_alias,
+    ReflectionKind.REFERENCE: _load_reference,
+    BlockTagKind.ALPHA: partial(_load_block_tag, BlockTagKind.ALPHA),
+    BlockTagKind.BETA: partial(_load_block_tag, BlockTagKind.BETA),
+    BlockTagKind.CATEGORY: partial(_load_block_tag, BlockTagKind.CATEGORY),
+    BlockTagKind.DEFAULT_VALUE: partial(_load_block_tag, BlockTagKind.DEFAULT_VALUE),
+    BlockTagKind.DEPRECATED: partial(_load_block_tag, BlockTagKind.DEPRECATED),
+    BlockTagKind.ENUM: partial(_load_block_tag, BlockTagKind.ENUM),
+    BlockTagKind.EVENT: partial(_load_block_tag, BlockTagKind.EVENT),
+    BlockTagKind.EVENT_PROPERTY: partial(_load_block_tag, BlockTagKind.EVENT_PROPERTY),
+    BlockTagKind.EXAMPLE: partial(_load_block_tag, BlockTagKind.EXAMPLE),
+    BlockTagKind.EXPERIMENTAL: partial(_load_block_tag, BlockTagKind.EXPERIMENTAL),
+    BlockTagKind.GROUP: partial(_load_block_tag, BlockTagKind.GROUP),
+    BlockTagKind.HIDDEN: partial(_load_block_tag, BlockTagKind.HIDDEN),
+    BlockTagKind.IGNORE: partial(_load_block_tag, BlockTagKind.IGNORE),
+    BlockTagKind.INHERIT_DOC: partial(_load_block_tag, BlockTagKind.INHERIT_DOC),
+    BlockTagKind.INTERFACE: partial(_load_block_tag, BlockTagKind.INTERFACE),
+    BlockTagKind.INTERNAL: partial(_load_block_tag, BlockTagKind.INTERNAL),
+    BlockTagKind.LABEL: partial(_load_block_tag, BlockTagKind.LABEL),
+    BlockTagKind.LINK: partial(_load_block_tag, BlockTagKind.LINK),
+    BlockTagKind.MODULE: partial(_load_block_tag, BlockTagKind.MODULE),
+    BlockTagKind.NAMESPACE: partial(_load_block_tag, BlockTagKind.NAMESPACE),
+    BlockTagKind.OVERLOAD: partial(_load_block_tag, BlockTagKind.OVERLOAD),
+    BlockTagKind.OVERRIDE: partial(_load_block_tag, BlockTagKind.OVERRIDE),
+    BlockTagKind.PACKAGE_DOCUMENTATION: partial(_load_block_tag, BlockTagKind.PACKAGE_DOCUMENTATION),
+    BlockTagKind.PARAM: partial(_load_block_tag, BlockTagKind.PARAM),
+    BlockTagKind.PRIVATE: partial(_load_block_tag, BlockTagKind.PRIVATE),
+    BlockTagKind.PRIVATE_REMARKS: partial(_load_block_tag, BlockTagKind.PRIVATE_REMARKS),
+    BlockTagKind.PROPERTY: partial(_load_block_tag, BlockTagKind.PROPERTY),
+    BlockTagKind.PROTECTED: partial(_load_block_tag, BlockTagKind.PROTECTED),
+    BlockTagKind.PUBLIC: partial(_load_block_tag, BlockTagKind.PUBLIC),
+    BlockTagKind.READONLY: partial(_load_block_tag, BlockTagKind.READONLY),
+    BlockTagKind.REMARKS: partial(_load_block_tag, BlockTagKind.REMARKS),
+    BlockTagKind.RETURNS: partial(_load_block_tag, BlockTagKind.RETURNS),
+    BlockTagKind.SATISFIES: partial(_load_block_tag, BlockTagKind.SATISFIES),
+    BlockTagKind.SEALED: partial(_load_block_tag, BlockTagKind.SEALED),
+    BlockTagKind.SEE: partial(_load_block_tag, BlockTagKind.SEE),
+    BlockTagKind.TEMPLATE: partial(_load_block_tag, BlockTagKind.TEMPLATE),
+    BlockTagKind.THROWS: partial(_load_block_tag, BlockTagKind.THROWS),
+    BlockTagKind.TYPE_PARAM: partial(_load_block_tag, BlockTagKind.TYPE_PARAM),
+    BlockTagKind.VIRTUAL: partial(_load_block_tag, BlockTagKind.VIRTUAL),
+    BlockTagContentKind.TEXT: partial(_load_block_tag_content, BlockTagContentKind.TEXT),
+    BlockTagContentKind.CODE: partial(_load_block_tag_content, BlockTagContentKind.CODE),
+    BlockTagContentKind.INLINE_TAG: partial(_load_block_tag_content, BlockTagContentKind.INLINE_TAG),
+}
@@ -0,0 +1,138 @@
+# This module contains a lazy loader, converting reflections from raw JSON data
+# only when their attributes are first accessed.
+
+from __future__ import annotations
+
+import sys
+from dataclasses import fields
+from typing import Any
+
+from griffe_typedoc._internal.decoder import TypedocDecoder, _kind_loaders
+from griffe_typedoc._internal.models import Project, Reflection, _name_slots, _parent_slots
+
+# Reflection classes by raw kind (kinds are constant properties, read on empty instances).
+_reflection_classes: dict[int, type[Reflection]] = {cls.__new__(cls).kind.to_int(): cls for cls in _parent_slots}
+
+# Memoized values and caches of each reflection class, to initialize as empty.
+_cache_fields: dict[type[Reflection], tuple[str, ...]] = {
+    cls: tuple(
+        field.name
+        for field in fields(cls)
+        if not field.init and field.default is None and field.name not in ("project", "_lazy")
+    )
+    for cls in _reflection_classes.values()
+}
+
+# Keys of reflections that have the reflection as parent (see the decoder).
+_CHILD_LIST_KEYS = ("children", "signatures", "parameters")
+_CHILD_KEYS = ("getSignature", "setSignature")
+
+# Keys that never contain reflections, and are not searched for them.
+_SKIPPED_KEYS = frozenset(
+    (
+        "id",
+        "name",
+        "variant",
+        "kind",
+        "flags",
+        "comment",
+        "sources",
+        "groups",
+        "categories",
+        "readme",
+        "symbolIdMap",
+        "files",
+        *_CHILD_LIST_KEYS,
+        *_CHILD_KEYS,
+    ),
+)
+
+# Attributes set on reflections before they are converted.
+_EAGER_ATTRIBUTES = frozenset(("id", "name", "variant", "parent"))
+
+
+class _LazyLoader:
+    def __init__(self) -> None:
+        self.decoder = TypedocDecoder()
+        self.symbol_map: dict[int, Reflection] = {}
+        self.project: Project | None = None
+
+    def load(self, data: dict[str, Any]) -> Project:
+        # Only create empty reflections, each one holding its raw data.
+        project: Project = self._create(data, None)  # type: ignore[assignment]
+        # The project itself is converted right away.
+        project.project = project._lazy = None
+        self.materialize(project, data)
+        return project
+
+    def _create(self, data: dict[str, Any], parent: Reflection | None) -> Reflection:
+        cls = _reflection_classes[data["kind"]]
+        reflection = cls.__new__(cls)
+        for name in _cache_fields[cls]:
+            setattr(reflection, name, None)
+        if self.project is None:
+            self.project = reflection  # type: ignore[assignment]
+        reflection.project = self.project
+        reflection._lazy = (self, data)
+        reflection.id = data["id"]
+        reflection.variant = sys.intern(data["variant"])
+        # New reflections have nothing memoized: bypass `Reflection.name` and `parent` invalidation.
+        _name_slots[cls].__set__(reflection, data["name"])
+        _parent_slots[cls].__set__(reflection, parent)
+        self.symbol_map[reflection.id] = reflection
+
+        for key in _CHILD_LIST_KEYS:
+            for child in data.get(key, ()):
+                self._create(child, reflection)
+        for key in _CHILD_KEYS:
+            if (child := data.get(key)) is not None:
+                self._create(child, reflection)
+        # Reflections nested elsewhere (type declarations, type parameters) have no parent.
+        for key, value in data.items():
+            if key not in _SKIPPED_KEYS and isinstance(value, (dict, list)):
+                self._create_nested(value)
+        return reflection
+
+    def _create_nested(self, data: Any) -> None:
+        stack = [data]
+        while stack:
+            data = stack.pop()
+            if type(data) is dict:
+                if type(data.get("kind")) is int:
+                    self._create(data, None)
+                else:
+                    stack.extend(data.values())
+            elif type(data) is list:
+                stack.extend(data)
+
+    def _convert(self, data: Any) -> Any:
+        # Convert raw data bottom-up, like `json.loads` with our decoder,
+        # except for reflections which already exist.
+        if isinstance(data, dict):
+            if isinstance(data.get("kind"), int):
+                return self.symbol_map[data["id"]]
+            return self.decoder._object_hook({key: self._convert(value) for key, value in data.items()})
+        if isinstance(data, list):
+            return [self._convert(value) for value in data]
+        return data
+
+    def materialize(self, reflection: Reflection, data: dict[str, Any]) -> None:
+        obj_dict = {key: self._convert(value) for key, value in data.items() if key != "kind"}
+        # Let the decoder build a complete reflection, then move its attributes into ours.
+        obj = _kind_loaders[data["kind"]](obj_dict, {})
+        for field in fields(obj):
+            if field.init and field.name not in _EAGER_ATTRIBUTES:
+                setattr(reflection, field.name, getattr(obj, field.name))
+        if isinstance(reflection, Project):
+            reflection.symbol_id_map = self.symbol_map
+            reflection.source_cache = obj.source_cache
+        # Children already have this parent: bypass `Reflection.parent` invalidation,
+        # which would clear memoized paths and the project's indexes for nothing.
+        for child in reflection._child_reflections():
+            _parent_slots[child.__class__].__set__(child, reflection)
+        for source in reflection.sources:
+            source.parent = reflection
+
+
+def _load_lazy(data: dict[str, Any]) -> Project:
+    return _LazyLoader().load(data)
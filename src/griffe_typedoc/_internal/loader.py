@@ -1,16 +1,29 @@
 from __future__ import annotations
 
+import asyncio
+import io
 import json
+import mmap
 import os
 import re
 import subprocess
-from tempfile import NamedTemporaryFile
-from typing import TYPE_CHECKING
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from tempfile import NamedTemporaryFile, TemporaryDirectory
+from typing import TYPE_CHECKING, Any
 
+from griffe_typedoc._internal.backends import _get_parser
 from griffe_typedoc._internal.decoder import TypedocDecoder
+from griffe_typedoc._internal.lazy import _load_lazy
 from griffe_typedoc._internal.logger import get_logger
+from griffe_typedoc._internal.memory import _gc_paused
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from griffe_typedoc._internal.cache import ProjectCache
     from griffe_typedoc._internal.models import Project
 
 _logger = get_logger(__name__)
@@ -20,40 +33,312 @@ def _double_brackets(message: str) -> str:
     return message.replace("{", "{{").replace("}", "}}")
 
 
-def load(typedoc_command: str | list[str], working_directory: str = ".") -> Project:
+def load(
+    typedoc_command: str | list[str],
+    working_directory: str = ".",
+    *,
+    cache: ProjectCache | None = None,
+    pipe: bool = False,
+) -> Project:
     """Load TypeScript API data using TypeDoc.
 
     Parameters:
         typedoc_command: Name/path of the 1`typedoc` executable, or a command as list.
         working_directory: Where to execute the command.
+        cache: A cache of previously decoded projects.
+            When the TypeDoc inputs did not change, the cached project is returned
+            without running TypeDoc.
+        pipe: Whether to receive TypeDoc's JSON output through a pipe (`/dev/fd/N`),
+            separate from its logs, instead of a temporary file.
+            This avoids writing the output to disk and reading it back.
+            Platforms without `/dev/fd` (Windows) fall back to a temporary file.
 
     Returns:
         Top-level project object containing API data.
     """
+    if cache is None:
+        return _load(typedoc_command, working_directory, pipe=pipe)
+    key = cache.fingerprint(typedoc_command, working_directory)
+    if (project := cache.get(key)) is not None:
+        _logger.debug(f"Loaded project from cache ({key})")
+        return project
+    project = _load(typedoc_command, working_directory, pipe=pipe)
+    cache.set(key, project)
+    return project
+
+
+def _load(typedoc_command: str | list[str], working_directory: str, *, pipe: bool = False) -> Project:
+    if pipe and os.path.isdir("/dev/fd"):
+        return load_json(_run_typedoc_piped(typedoc_command, working_directory))
     with NamedTemporaryFile("r+") as tmpfile:
-        if isinstance(typedoc_command, str):
-            typedoc_command += f" --json {tmpfile.name}"
-            shell = True
+        _run_typedoc(typedoc_command, working_directory, tmpfile.name)
+        return load_json(tmpfile.name)
+
+
+def _run_typedoc(typedoc_command: str | list[str], working_directory: str, json_path: str) -> int:
+    process = _start_typedoc(typedoc_command, working_directory, json_path)
+    _log_typedoc_output(process)
+    return process.wait()
+
+
+def _run_typedoc_piped(typedoc_command: str | list[str], working_directory: str) -> bytes:
+    read_fd, write_fd = os.pipe()
+    try:
+        process = _start_typedoc(typedoc_command, working_directory, f"/dev/fd/{write_fd}", pass_fds=(write_fd,))
+    except BaseException:
+        os.close(read_fd)
+        raise
+    finally:
+        # Only TypeDoc keeps the write end open: we get EOF when it exits.
+        os.close(write_fd)
+    # Logs and JSON come through separate pipes: read both at once, so that neither fills up.
+    log_thread = threading.Thread(target=_log_typedoc_output, args=(process,), daemon=True)
+    log_thread.start()
+    with os.fdopen(read_fd, "rb") as reader:
+        contents = reader.read()
+    log_thread.join()
+    process.wait()
+    return contents
+
+
+def _start_typedoc(
+    typedoc_command: str | list[str],
+    working_directory: str,
+    json_path: str,
+    pass_fds: tuple[int, ...] = (),
+) -> subprocess.Popen:
+    if isinstance(typedoc_command, str):
+        typedoc_command += f" --json {json_path}"
+        shell = True
+    else:
+        typedoc_command = [*typedoc_command, "--json", json_path]
+        shell = False
+    return subprocess.Popen(  # noqa: S603
+        typedoc_command,
+        shell=shell,
+        text=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        cwd=working_directory,
+        env=_typedoc_env(),
+        pass_fds=pass_fds,
+    )
+
+
+def _log_typedoc_output(process: subprocess.Popen) -> None:
+    while True:
+        if line := process.stdout.readline().strip():  # type: ignore[union-attr]
+            _log_typedoc_line(line)
         else:
-            typedoc_command += ["--json", tmpfile.name]
-            shell = False
-        env = os.environ.copy()
-        env["NO_COLOR"] = "1"
-        process = subprocess.Popen(  # noqa: S603
-            typedoc_command,
-            shell=shell,
-            text=True,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            cwd=working_directory,
-            env=env,
-        )
-        while True:
-            if line := process.stdout.readline().strip():  # type: ignore[union-attr]
-                level, line = line.split(" ", 1)
-                level = match.group(1) if (match := re.search(r"\[(\w+)\]", level)) else "info"
-                getattr(_logger, level.lower())(_double_brackets(line))
-            else:
-                break
-        process.wait()
-        return json.load(tmpfile, cls=TypedocDecoder)
+            break
+
+
+def _typedoc_env() -> dict[str, str]:
+    env = os.environ.copy()
+    env["NO_COLOR"] = "1"
+    return env
+
+
+def _log_typedoc_line(line: str) -> None:
+    level, line = line.split(" ", 1) if " " in line else ("", line)
+    level = match.group(1) if (match := re.search(r"\[(\w+)\]", level)) else "info"
+    getattr(_logger, level.lower())(_double_brackets(line))
+
+
+async def load_async(
+    typedoc_command: str | list[str],
+    working_directory: str = ".",
+    *,
+    cache: ProjectCache | None = None,
+    timeout: float | None = None,
+) -> Project:
+    """Load TypeScript API data using TypeDoc, without blocking the event loop.
+
+    TypeDoc's output is logged while it runs, and its JSON output is decoded
+    in a separate thread. If the task is cancelled or times out, TypeDoc is killed.
+
+    Parameters:
+        typedoc_command: Name/path of the `typedoc` executable, or a command as list.
+        working_directory: Where to execute the command.
+        cache: A cache of previously decoded projects.
+        timeout: Maximum time to wait for TypeDoc to finish, in seconds.
+
+    Raises:
+        asyncio.TimeoutError: When TypeDoc did not finish in time
+            (the built-in `TimeoutError` since Python 3.11).
+
+    Returns:
+        Top-level project object containing API data.
+    """
+    if cache is not None:
+        key = await asyncio.to_thread(cache.fingerprint, typedoc_command, working_directory)
+        if (project := await asyncio.to_thread(cache.get, key)) is not None:
+            _logger.debug(f"Loaded project from cache ({key})")
+            return project
+    with NamedTemporaryFile("r+") as tmpfile:
+        await asyncio.wait_for(_run_typedoc_async(typedoc_command, working_directory, tmpfile.name), timeout)
+        project = await asyncio.to_thread(load_json, tmpfile.name)
+    if cache is not None:
+        await asyncio.to_thread(cache.set, key, project)
+    return project
+
+
+async def _run_typedoc_async(typedoc_command: str | list[str], working_directory: str, json_path: str) -> None:
+    options: dict[str, Any] = {
+        "stdout": subprocess.PIPE,
+        "stderr": subprocess.STDOUT,
+        "cwd": working_directory,
+        "env": _typedoc_env(),
+    }
+    if isinstance(typedoc_command, str):
+        process = await asyncio.create_subprocess_shell(f"{typedoc_command} --json {json_path}", **options)
+    else:
+        process = await asyncio.create_subprocess_exec(*typedoc_command, "--json", json_path, **options)
+    try:
+        async for line in process.stdout:  # type: ignore[union-attr]
+            if text := line.decode(errors="replace").strip():
+                _log_typedoc_line(text)
+        await process.wait()
+    except BaseException:
+        # Cancelled (or timed out): don't leave TypeDoc running.
+        if process.returncode is None:
+            process.kill()
+            await asyncio.shield(process.wait())
+        raise
+
+
+def load_many(
+    typedoc_command: str | list[str],
+    working_directories: Iterable[str],
+    *,
+    max_workers: int | None = None,
+    cache: ProjectCache | None = None,
+) -> dict[str, Project]:
+    """Load TypeScript API data of several packages using TypeDoc, concurrently.
+
+    TypeDoc runs in each working directory concurrently, and each JSON output
+    is decoded as soon as it is written. Packages that fail to load are logged
+    and left out of the results, without preventing other packages from loading.
+
+    Parameters:
+        typedoc_command: Name/path of the `typedoc` executable, or a command as list.
+        working_directories: Where to execute the command, one directory per package.
+        max_workers: Maximum number of concurrent TypeDoc runs.
+            Default: the number of processors.
+        cache: A cache of previously decoded projects.
+
+    Returns:
+        Top-level project objects, by working directory.
+    """
+    working_directories = list(dict.fromkeys(working_directories))
+    if not working_directories:
+        return {}
+    max_workers = max_workers or os.cpu_count() or 1
+    projects = {}
+    # Projects are decoded by the runner threads: decoding in other processes would not be faster,
+    # since restoring the pickled projects takes about as long as decoding them (see the `snapshot` benchmark).
+    with TemporaryDirectory() as tmpdir, ThreadPoolExecutor(min(max_workers, len(working_directories))) as runners:
+
+        def load_one(index: int, working_directory: str) -> Project:
+            if cache is not None:
+                key = cache.fingerprint(typedoc_command, working_directory)
+                if (project := cache.get(key)) is not None:
+                    _logger.debug(f"Loaded project from cache ({key})")
+                    return project
+            json_path = os.path.join(tmpdir, f"{index}.json")
+            _run_typedoc(typedoc_command, working_directory, json_path)
+            project = load_json(json_path)
+            if cache is not None:
+                cache.set(key, project)
+            return project
+
+        futures = {
+            working_directory: runners.submit(load_one, index, working_directory)
+            for index, working_directory in enumerate(working_directories)
+        }
+        for working_directory, future in futures.items():
+            try:
+                projects[working_directory] = future.result()
+            except Exception as error:  # noqa: BLE001
+                _logger.error(f"Could not load package in {working_directory}: {_double_brackets(str(error))}")  # noqa: TRY400
+    return projects
+
+
+def load_json(
+    source: str | Path | bytes | bytearray,
+    *,
+    memory_map: bool = False,
+    streaming: bool = False,
+    lazy: bool = False,
+    reverse_references: bool = False,
+    backend: str = "json",
+) -> Project:
+    """Load TypeScript API data from TypeDoc's JSON output.
+
+    Parameters:
+        source: Path to a JSON file generated by TypeDoc (`typedoc --json`), or its contents.
+        memory_map: Whether to memory-map the file instead of reading it,
+            which avoids building an intermediate `bytes` object (the decoded text is still built in memory).
+        streaming: Whether to decode the file while reading it, chunk by chunk.
+            This is slower, but keeps memory usage low on very large files.
+            See [`TypedocDecoder.decode_stream`][griffe_typedoc.TypedocDecoder.decode_stream].
+        lazy: Whether to convert reflections only when their attributes are first accessed.
+            Reflections are all created, with their id, name and parent,
+            but the rest of their data (children, signatures, types, comments, etc.)
+            is converted on demand. This is much faster when only a few modules are used.
+            Not compatible with `streaming`.
+        reverse_references: Whether to index reflections referencing each reflection while decoding,
+            for [`Project.referenced_by`][griffe_typedoc.Project.referenced_by].
+            Otherwise (and with `lazy`), the index is built on first use.
+        backend: The library parsing JSON: `json` (standard library), `orjson` or `msgspec`.
+            Other libraries parse the document into dictionaries and lists, then the decoder
+            converts them in a single pass. They parse faster, but this extra pass
+            usually makes eager decoding slower than with the standard library,
+            which calls the decoder while parsing. They are faster with `lazy`.
+            Not compatible with `streaming`.
+
+    Raises:
+        ValueError: When `streaming` is combined with `lazy` or another backend,
+            or when the backend is unknown.
+
+    Returns:
+        Top-level project object containing API data.
+    """
+    parse = _get_parser(backend)
+    if streaming:
+        if lazy:
+            raise ValueError("Streaming and lazy decoding cannot be combined")
+        if backend != "json":
+            raise ValueError("Streaming decoding only supports the 'json' backend")
+        decoder = TypedocDecoder(reverse_references=reverse_references)
+        if isinstance(source, (bytes, bytearray)):
+            # Contents are already in memory: only the decoded objects are built incrementally.
+            return decoder.decode_stream(io.StringIO(source.decode("utf8")))
+        with Path(source).open(encoding="utf8") as file:
+            return decoder.decode_stream(file)
+    decode = partial(_decode, lazy=lazy, reverse_references=reverse_references, parse=parse)
+    if isinstance(source, (bytes, bytearray)):
+        return decode(source)
+    with Path(source).open("rb") as file:
+        # Empty files cannot be mapped: read them, to report the same decoding error.
+        if memory_map and os.fstat(file.fileno()).st_size:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return decode(str(mapped, "utf8"))
+        return decode(file.read())
+
+
+def _decode(
+    contents: str | bytes | bytearray,
+    *,
+    lazy: bool,
+    reverse_references: bool,
+    parse: Callable[[str | bytes | bytearray], Any],
+) -> Project:
+    # Decoding creates many objects at once, none of which can be garbage before the project is returned:
+    # pausing the garbage collector saves a large part of the decoding time.
+    with _gc_paused():
+        if lazy:
+            return _load_lazy(parse(contents))
+        if parse is json.loads:
+            return json.loads(contents, cls=TypedocDecoder, reverse_references=reverse_references)
+        return TypedocDecoder(reverse_references=reverse_references).convert(parse(contents))
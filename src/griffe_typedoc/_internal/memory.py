@@ -0,0 +1,23 @@
+# This module contains memory management utilities.
+
+from __future__ import annotations
+
+import gc
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    # Decoding and restoring projects create many container objects at once, which triggers
+    # the garbage collector over and over again, while none of these objects can be garbage yet.
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
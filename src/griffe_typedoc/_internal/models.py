@@ -1,10 +1,14 @@
 from __future__ import annotations
 
 import enum
-from dataclasses import dataclass, field
-from functools import cached_property
+from dataclasses import dataclass, field, fields
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+from griffe_typedoc._internal.sources import SourceCache
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
 
 # from pydantic.dataclasses import dataclass, Field as field
 
@@ -56,58 +60,38 @@ class ReflectionKind(enum.Enum):
 
     @classmethod
     def from_int(cls, value: int) -> ReflectionKind:
-        return {
-            0x1: cls.PROJECT,
-            0x2: cls.MODULE,
-            0x4: cls.NAMESPACE,
-            0x8: cls.ENUM,
-            0x10: cls.ENUM_MEMBER,
-            0x20: cls.VARIABLE,
-            0x40: cls.FUNCTION,
-            0x80: cls.CLASS,
-            0x100: cls.INTERFACE,
-            0x200: cls.CONSTRUCTOR,
-            0x400: cls.PROPERTY,
-            0x800: cls.METHOD,
-            0x1000: cls.CALL_SIGNATURE,
-            0x2000: cls.INDEX_SIGNATURE,
-            0x4000: cls.CONSTRUCTOR_SIGNATURE,
-            0x8000: cls.PARAMETER,
-            0x10000: cls.TYPE_LITERAL,
-            0x20000: cls.TYPE_PARAMETER,
-            0x40000: cls.ACCESSOR,
-            0x80000: cls.GET_SIGNATURE,
-            0x100000: cls.SET_SIGNATURE,
-            0x200000: cls.TYPE_ALIAS,
-            0x400000: cls.REFERENCE,
-        }[value]
+        return _reflection_kinds_by_int[value]
 
     def to_int(self) -> int:
-        return {
-            self.PROJECT: 0x1,
-            self.MODULE: 0x2,
-            self.NAMESPACE: 0x4,
-            self.ENUM: 0x8,
-            self.ENUM_MEMBER: 0x10,
-            self.VARIABLE: 0x20,
-            self.FUNCTION: 0x40,
-            self.CLASS: 0x80,
-            self.INTERFACE: 0x100,
-            self.CONSTRUCTOR: 0x200,
-            self.PROPERTY: 0x400,
-            self.METHOD: 0x800,
-            self.CALL_SIGNATURE: 0x1000,
-            self.INDEX_SIGNATURE: 0x2000,
-            self.CONSTRUCTOR_SIGNATURE: 0x4000,
-            self.PARAMETER: 0x8000,
-            self.TYPE_LITERAL: 0x10000,
-            self.TYPE_PARAMETER: 0x20000,
-            self.ACCESSOR: 0x40000,
-            self.GET_SIGNATURE: 0x80000,
-            self.SET_SIGNATURE: 0x100000,
-            self.TYPE_ALIAS: 0x200000,
-            self.REFERENCE: 0x400000,
-        }[self]  # type: ignore[index]
+        return _reflection_kinds_to_int[self]
+
+
+_reflection_kinds_by_int = {
+    0x1: ReflectionKind.PROJECT,
+    0x2: ReflectionKind.MODULE,
+    0x4: ReflectionKind.NAMESPACE,
+    0x8: ReflectionKind.ENUM,
+    0x10: ReflectionKind.ENUM_MEMBER,
+    0x20: ReflectionKind.VARIABLE,
+    0x40: ReflectionKind.FUNCTION,
+    0x80: ReflectionKind.CLASS,
+    0x100: ReflectionKind.INTERFACE,
+    0x200: ReflectionKind.CONSTRUCTOR,
+    0x400: ReflectionKind.PROPERTY,
+    0x800: ReflectionKind.METHOD,
+    0x1000: ReflectionKind.CALL_SIGNATURE,
+    0x2000: ReflectionKind.INDEX_SIGNATURE,
+    0x4000: ReflectionKind.CONSTRUCTOR_SIGNATURE,
+    0x8000: ReflectionKind.PARAMETER,
+    0x10000: ReflectionKind.TYPE_LITERAL,
+    0x20000: ReflectionKind.TYPE_PARAMETER,
+    0x40000: ReflectionKind.ACCESSOR,
+    0x80000: ReflectionKind.GET_SIGNATURE,
+    0x100000: ReflectionKind.SET_SIGNATURE,
+    0x200000: ReflectionKind.TYPE_ALIAS,
+    0x400000: ReflectionKind.REFERENCE,
+}
+_reflection_kinds_to_int = {kind: value for value, kind in _reflection_kinds_by_int.items()}
 
 
 # https://typedoc.org/guides/tags/
@@ -159,20 +143,23 @@ class BlockTagContentKind(enum.Enum):
     INLINE_TAG = "inline-tag"
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class FileRegistry:
     entries: dict[int, str]
     reflections: dict[int, int]
+    _reverse_reflections: dict[int, int] | None = field(default=None, init=False, repr=False, compare=False)
 
-    @cached_property
+    @property
     def reverse_reflections(self) -> dict[int, int]:
-        return {value: key for key, value in self.reflections.items()}
+        if self._reverse_reflections is None:
+            self._reverse_reflections = {value: key for key, value in self.reflections.items()}
+        return self._reverse_reflections
 
     def filepath(self, reflection_id: int) -> str:
         return self.entries[self.reverse_reflections[reflection_id]]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class BlockTagContent:
     kind: BlockTagContentKind
     text: str
@@ -190,7 +177,7 @@ class BlockTagContent:
         return self.text
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class BlockTag:
     kind: BlockTagKind
     content: list[BlockTagContent]
@@ -202,7 +189,7 @@ class BlockTag:
         return "".join(block.markdown(**kwargs) for block in self.summary)  # type: ignore[attr-defined]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Comment:
     summary: list[BlockTagContent]
     tags: list[BlockTag] | None = None
@@ -215,38 +202,39 @@ class Comment:
         return "".join(block.markdown(**kwargs) for block in self.summary)
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Group:
     title: str
     children: list[int | Reflection]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Source:
     file_name: str
     line: int
     character: int
     url: str | None = None
+    parent: Reflection | None = field(default=None, repr=False, compare=False)
 
     @property
     def filepath(self) -> str:
-        root = self.parent.root  # type: ignore[attr-defined]
+        root = self.parent.root  # type: ignore[union-attr]
         try:
-            return root.files.filepath(self.parent.root_module.id)  # type: ignore[attr-defined]
+            return root.files.filepath(self.parent.root_module.id)  # type: ignore[attr-defined,union-attr]
         except IndexError:
-            return root.files.filepath(root.id)
+            return root.files.filepath(root.id)  # type: ignore[union-attr]
 
     @property
     def contents(self) -> str:
+        filepath = self.filepath
+        source_cache = self.parent.root.source_cache  # type: ignore[union-attr]
         try:
-            with Path(self.filepath).open() as file:
-                return file.readlines()[self.line - 1]
+            return source_cache.line(filepath, self.line)
         except (OSError, IndexError):
-            with Path(self.filepath).with_name(self.file_name).open() as file:
-                return file.readlines()[self.line - 1]
+            return source_cache.line(Path(filepath).with_name(self.file_name), self.line)
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Target:
     source_file_name: str
     qualified_name: str
@@ -266,7 +254,7 @@ class TypeKind(enum.Enum):
     MAPPED = "mapped"
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Type:
     type: TypeKind
     name: str | None = None
@@ -290,6 +278,31 @@ class Type:
 
 @dataclass(kw_only=True)
 class Reflection:
+    # Base class of reflections: its fields are slots of each concrete class instead.
+    # On Python 3.10, slotted dataclasses re-declare inherited fields as their own slots,
+    # which would hold every field twice (and hide the wrappers of `parent` and `name`).
+    # Hidden from type checkers, which would otherwise reject assignments to reflections.
+    if not TYPE_CHECKING:
+        __slots__ = ()
+
+    # Memoized values of `path`, `root` and `root_module`, cleared when `parent` or `name` change.
+    # They are declared first so that they are initialized before `parent` and `name`.
+    _path: str | None = field(default=None, init=False, repr=False, compare=False)
+    _root: Reflection | None = field(default=None, init=False, repr=False, compare=False)
+    _root_module: Reflection | None = field(default=None, init=False, repr=False, compare=False)
+    # The project this reflection was decoded in, set by the decoder.
+    # Slotted dataclasses can only be weakly referenced from Python 3.11 (`weakref_slot`),
+    # and reflections already reference their parent anyway, so this is a strong reference.
+    project: Project | None = field(default=None, init=False, repr=False, compare=False)
+    # Raw data of reflections decoded lazily, converted on first access to their attributes.
+    _lazy: Any = field(default=None, init=False, repr=False, compare=False)
+    # Groups with resolved children, and group titles by child id, for the current `groups` list.
+    _resolved_groups: tuple[list[Group], list[Group], dict[int, str]] | None = field(
+        default=None,
+        init=False,
+        repr=False,
+        compare=False,
+    )
     id: int
     name: str
     variant: str
@@ -305,30 +318,85 @@ class Reflection:
     def kind(self) -> ReflectionKind:
         raise NotImplementedError
 
+    # Hidden from type checkers, which would otherwise accept any attribute on reflections.
+    if not TYPE_CHECKING:
+
+        def __getattr__(self, name: str) -> Any:
+            # Called when an attribute is missing, i.e. unset slots of lazy reflections,
+            # but also when a property raises `AttributeError`: only convert for the former.
+            if name in _lazy_fields[self.__class__] and self._lazy is not None:
+                self._materialize()
+            # Look the attribute up again, raising the original error if it is still missing.
+            return object.__getattribute__(self, name)
+
+    def _materialize(self) -> None:
+        # Convert the raw data of a lazily decoded reflection.
+        if (lazy := self._lazy) is not None:
+            self._lazy = None
+            loader, data = lazy
+            loader.materialize(self, data)
+
+    def __setstate__(self, state: tuple[None, dict[str, Any]]) -> None:
+        # Used by `pickle` (snapshots) and `copy`. Attributes are restored in any order:
+        # set `name` and `parent` through their underlying slots, since clearing memoized paths
+        # would read attributes that may not be restored yet.
+        cls = self.__class__
+        for name, value in state[1].items():
+            if name == "parent":
+                _parent_slots[cls].__set__(self, value)
+            elif name == "name":
+                _name_slots[cls].__set__(self, value)
+            else:
+                setattr(self, name, value)
+
+    def _clear_cached_paths(self) -> None:
+        # A reflection only memoizes these values once its parent did,
+        # so we can stop descending as soon as a reflection has nothing memoized.
+        if self._path is None and self._root is None and self._root_module is None:
+            return
+        self._path = self._root = self._root_module = None
+        for child in self._child_reflections():
+            child._clear_cached_paths()
+
+    def _child_reflections(self) -> Iterator[Reflection]:
+        # Reflections that have this one as parent.
+        yield from self.children
+        yield from getattr(self, "signatures", None) or ()
+        yield from getattr(self, "parameters", None) or ()
+        for accessor_signature in (getattr(self, "get_signature", None), getattr(self, "set_signature", None)):
+            if accessor_signature is not None:
+                yield accessor_signature
+
     @property
     def root_module(self) -> Reflection:
-        parent = self
-        while parent.parent and parent.parent.kind is not ReflectionKind.PROJECT:
-            parent = parent.parent
-        return parent
+        if self._root_module is None:
+            if self.parent is None or self.parent.kind is ReflectionKind.PROJECT:
+                self._root_module = self
+            else:
+                self._root_module = self.parent.root_module
+        return self._root_module
 
     @property
     def root(self) -> Reflection:
-        parent = self
-        while parent.parent:
-            parent = parent.parent
-        return parent
+        if self._root is None:
+            self._root = self if self.parent is None else self.parent.root
+        return self._root
 
     @property
     def path(self) -> str:
-        if self.parent is None or isinstance(self.parent, Project):
-            return self.name
-        if self.kind is ReflectionKind.MODULE and self.name == "index":
-            return self.parent.path
-        return f"{self.parent.path}/{self.name}"
+        if self._path is None:
+            if self.parent is None or isinstance(self.parent, Project):
+                self._path = self.name
+            elif self.kind is ReflectionKind.MODULE and self.name == "index":
+                self._path = self.parent.path
+            else:
+                self._path = f"{self.parent.path}/{self.name}"
+        return self._path
 
     @property
     def symbol_map(self) -> dict[int, Reflection]:
+        if self.project is not None:
+            return self.project.symbol_id_map
         try:
             return self.parent.symbol_map  # type: ignore[union-attr]
         except AttributeError:
@@ -347,27 +415,104 @@ class Reflection:
 
     @property
     def resolved_groups(self) -> list[Group]:
-        return [
-            Group(
-                title=group.title,
-                children=[self.symbol_map[child] if isinstance(child, int) else child for child in group.children],
-            )
-            for group in self.groups
-        ]
+        # Resolved once, then cached until `groups` is assigned another list.
+        return self._get_resolved_groups()[1]
+
+    def group_title(self, child: Reflection | int) -> str | None:
+        """Find the title of the group a child belongs to.
+
+        Parameters:
+            child: The child reflection, or its id.
+
+        Returns:
+            The group title, or none if the child is not grouped.
+        """
+        if isinstance(child, Reflection):
+            child = child.id
+        return self._get_resolved_groups()[2].get(child)
+
+    def _get_resolved_groups(self) -> tuple[list[Group], list[Group], dict[int, str]]:
+        if (cached := self._resolved_groups) is not None and cached[0] is self.groups:
+            return cached
+        symbol_map = self.symbol_map
+        resolved_groups = []
+        titles: dict[int, str] = {}
+        for group in self.groups:
+            children: list[int | Reflection] = [
+                symbol_map[child] if isinstance(child, int) else child for child in group.children
+            ]
+            resolved_groups.append(Group(title=group.title, children=children))
+            for child in children:
+                titles.setdefault(child.id, group.title)  # type: ignore[union-attr]
+        self._resolved_groups = (self.groups, resolved_groups, titles)
+        return self._resolved_groups
 
-    # TODO: Optimize: get source once (cache it), use line numbers of all sources to get relevant lines.
     @property
     def source_contents(self) -> str:
         return "\n".join(source.contents for source in self.sources).rstrip().removesuffix("{")
 
 
-@dataclass(kw_only=True)
+# Like slotted dataclasses, do not keep default values as class attributes:
+# subclasses redeclaring a field without a default (like `Variable.type`) would inherit them.
+for _field in fields(Reflection):
+    if _field.name in Reflection.__dict__:
+        delattr(Reflection, _field.name)
+
+
+def _collect_targets(value: Any, targets: dict[int, None]) -> None:
+    # Collect the targets of types, without descending into reflections (type declarations).
+    if isinstance(value, Type):
+        if type(value.target) is int:
+            targets[value.target] = None
+        for type_field in fields(value):
+            _collect_targets(getattr(value, type_field.name), targets)
+    elif isinstance(value, list):
+        for item in value:
+            _collect_targets(item, targets)
+
+
+def _reflection_targets(reflection: Reflection) -> dict[int, None]:
+    # Targets of the types declared by a reflection itself, in order and without duplicates.
+    targets: dict[int, None] = {}
+    for reflection_field in fields(reflection):
+        if reflection_field.init and reflection_field.name != "parent":
+            _collect_targets(getattr(reflection, reflection_field.name), targets)
+    return targets
+
+
+class _PathSlot:
+    # Wraps the slot of an attribute that `Reflection.path`, `root` and `root_module` depend on,
+    # to clear their memoized values on assignment. Overriding `__setattr__` instead
+    # would slow down the initialization of every reflection, for every attribute.
+    def __init__(self, slot: Any) -> None:
+        self._slot = slot
+
+    def __get__(self, instance: Reflection | None, owner: type | None = None) -> Any:
+        if instance is None:
+            return self
+        return self._slot.__get__(instance, owner)
+
+    def __set__(self, instance: Reflection, value: Any) -> None:
+        self._slot.__set__(instance, value)
+        instance._clear_cached_paths()
+        if (project := instance.project) is not None:
+            project._clear_indexes()
+
+
+@dataclass(kw_only=True, slots=True)
 class Project(Reflection):
     package_name: str  # type: ignore[misc]
     readme: list[BlockTagContent] | None = None
     symbol_id_map: dict[int, Reflection] = field(default_factory=dict, repr=False)
     package_version: str | None = None
     files: FileRegistry | None = None
+    source_cache: SourceCache = field(default_factory=SourceCache, init=False, repr=False, compare=False)
+    # Indexes of reflections by path and by name, built on first lookup,
+    # cleared when reflections of the project are renamed or moved.
+    _path_index: dict[str, Reflection] | None = field(default=None, init=False, repr=False, compare=False)
+    _name_index: dict[str, tuple[Reflection, ...]] | None = field(default=None, init=False, repr=False, compare=False)
+    # Reflections referencing each reflection (by id), built by the decoder or on first use.
+    _references: dict[int, list[Reflection]] | None = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def kind(self) -> ReflectionKind:
@@ -377,11 +522,100 @@ class Project(Reflection):
     def symbol_map(self) -> dict[int, Reflection]:
         return self.symbol_id_map
 
-
-@dataclass(kw_only=True)
+    def lookup(self, path: str) -> Reflection:
+        """Find a reflection by its path.
+
+        When several reflections share a path (for example a function and its signatures),
+        the first one in the tree wins.
+
+        Parameters:
+            path: The path of the reflection, like `module/Class/method`.
+
+        Raises:
+            KeyError: When no reflection has this path.
+
+        Returns:
+            The reflection.
+        """
+        if self._path_index is None:
+            self._build_indexes()
+        return self._path_index[path]  # type: ignore[index]
+
+    def lookup_name(self, name: str) -> tuple[Reflection, ...]:
+        """Find reflections by their name.
+
+        Parameters:
+            name: The name of the reflections.
+
+        Returns:
+            The reflections with this name, in tree order (possibly none).
+        """
+        if self._name_index is None:
+            self._build_indexes()
+        return self._name_index.get(name, ())  # type: ignore[union-attr]
+
+    def _build_indexes(self) -> None:
+        # Only reflections of the tree are indexed: type declarations have no parent, hence no path.
+        path_index: dict[str, Reflection] = {}
+        name_index: dict[str, list[Reflection]] = {}
+        stack = list(self._child_reflections())
+        stack.reverse()
+        while stack:
+            reflection = stack.pop()
+            path_index.setdefault(reflection.path, reflection)
+            name_index.setdefault(reflection.name, []).append(reflection)
+            children = list(reflection._child_reflections())
+            children.reverse()
+            stack.extend(children)
+        self._path_index = path_index
+        self._name_index = {name: tuple(reflections) for name, reflections in name_index.items()}
+
+    def _clear_indexes(self) -> None:
+        self._path_index = self._name_index = None
+
+    def referenced_by(self, target: Reflection | int) -> tuple[Reflection, ...]:
+        """Find reflections referencing a reflection through their types.
+
+        This includes the types of variables, properties, parameters and signatures,
+        extended and implemented types, and inherited or overwritten members.
+        A reference is attributed to the innermost reflection declaring the type,
+        for example a parameter rather than its signature.
+        The index is built while decoding with `reverse_references=True`,
+        otherwise on first use.
+
+        Parameters:
+            target: The referenced reflection, or its id.
+
+        Returns:
+            The reflections referencing the target, in decoding order (possibly none).
+        """
+        if self._references is None:
+            self._build_references()
+        if isinstance(target, Reflection):
+            target = target.id
+        return tuple(self._references.get(target, ()))  # type: ignore[union-attr]
+
+    def _build_references(self) -> None:
+        # Same result as the decoder: the symbol map is in decoding order,
+        # and each type belongs to the innermost reflection declaring it.
+        references: dict[int, list[Reflection]] = {}
+        for reflection in self.symbol_id_map.values():
+            for target in _reflection_targets(reflection):
+                references.setdefault(target, []).append(reflection)
+        self._references = references
+
+
+@dataclass(kw_only=True, slots=True)
 class Module(Reflection):
     package_version: str | None = None
     readme: str | None = None
+    # Exports, for the current `children` list.
+    _exports: tuple[list[Reflection], list[Reflection]] | None = field(
+        default=None,
+        init=False,
+        repr=False,
+        compare=False,
+    )
 
     @property
     def kind(self) -> ReflectionKind:
@@ -389,34 +623,39 @@ class Module(Reflection):
 
     @property
     def exports(self) -> list[Reflection]:
-        for child in self.children:
-            if child.kind is ReflectionKind.FUNCTION and child.name == "export=":
-                return child.exports  # type: ignore[attr-defined]
-        return []
-
-
-@dataclass(kw_only=True)
+        # Computed once, then cached until `children` is assigned another list.
+        if (cached := self._exports) is None or cached[0] is not self.children:
+            exports = []
+            for child in self.children:
+                if child.kind is ReflectionKind.FUNCTION and child.name == "export=":
+                    exports = child.exports  # type: ignore[attr-defined]
+                    break
+            self._exports = cached = (self.children, exports)
+        return cached[1]
+
+
+@dataclass(kw_only=True, slots=True)
 class Namespace(Reflection):
     @property
     def kind(self) -> ReflectionKind:
         return ReflectionKind.NAMESPACE
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Enum(Reflection):
     @property
     def kind(self) -> ReflectionKind:
         return ReflectionKind.ENUM
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class EnumMember(Reflection):
     @property
     def kind(self) -> ReflectionKind:
         return ReflectionKind.ENUM_MEMBER
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Variable(Reflection):
     type: Type  # type: ignore[misc]
     default_value: str | None = None
@@ -426,9 +665,16 @@ class Variable(Reflection):
         return ReflectionKind.VARIABLE
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Function(Reflection):
     signatures: list[CallSignature]  # type: ignore[misc]
+    # Exports, for the current `signatures` list.
+    _exports: tuple[list[CallSignature], list[Reflection]] | None = field(
+        default=None,
+        init=False,
+        repr=False,
+        compare=False,
+    )
 
     @property
     def kind(self) -> ReflectionKind:
@@ -436,19 +682,27 @@ class Function(Reflection):
 
     @property
     def exports(self) -> list[Reflection]:
-        return [
-            Reference(
-                id=prop.id,
-                variant="reference",
-                name=prop.name,
-                target=prop.type.target,  # type: ignore[arg-type,union-attr]
-                parent=self.parent,
-            )
-            for prop in self.signatures[0].type.declaration.children  # type: ignore[union-attr]
-        ]
-
-
-@dataclass(kw_only=True)
+        # Computed once, then cached until `signatures` is assigned another list,
+        # so that references keep the same identity across accesses.
+        if (cached := self._exports) is None or cached[0] is not self.signatures:
+            exports: list[Reflection] = []
+            for prop in self.signatures[0].type.declaration.children:  # type: ignore[union-attr]
+                reference = Reference(
+                    id=prop.id,
+                    variant="reference",
+                    name=prop.name,
+                    target=prop.type.target,  # type: ignore[arg-type,union-attr]
+                    parent=self.parent,
+                )
+                # References share the ids of the type literal's properties:
+                # they are not registered in the symbol map, but resolve their targets through the project.
+                reference.project = self.project
+                exports.append(reference)
+            self._exports = cached = (self.signatures, exports)
+        return cached[1]
+
+
+@dataclass(kw_only=True, slots=True)
 class Class(Reflection):
     extended_types: list[Type] | None = None
     extended_by: list[Type] | None = None
@@ -461,7 +715,7 @@ class Class(Reflection):
         return ReflectionKind.CLASS
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Interface(Reflection):
     extended_types: list[Type] | None = None
     extended_by: list[Type] | None = None
@@ -476,7 +730,7 @@ class Interface(Reflection):
         return ReflectionKind.INTERFACE
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Constructor(Reflection):
     signatures: list[ConstructorSignature] | None = None
     overwrites: Type | None = None
@@ -487,7 +741,7 @@ class Constructor(Reflection):
         return ReflectionKind.CONSTRUCTOR
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Property(Reflection):
     type: Type  # type: ignore[misc]
     inherited_from: Type | None = None
@@ -500,7 +754,7 @@ class Property(Reflection):
         return ReflectionKind.PROPERTY
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Method(Reflection):
     signatures: list[CallSignature]  # type: ignore[misc]
     overwrites: Type | None = None
@@ -512,7 +766,7 @@ class Method(Reflection):
         return ReflectionKind.METHOD
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class CallSignature(Reflection):
     type: Type  # type: ignore[misc]
     parameters: list[Parameter] | None = None
@@ -526,7 +780,7 @@ class CallSignature(Reflection):
         return ReflectionKind.CALL_SIGNATURE
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class IndexSignature(Reflection):
     type: Type  # type: ignore[misc]
     parameters: list[Parameter] | None = None
@@ -536,7 +790,7 @@ class IndexSignature(Reflection):
         return ReflectionKind.INDEX_SIGNATURE
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ConstructorSignature(Reflection):
     parameters: list[Parameter] | None = None
     overwrites: Type | None = None
@@ -548,7 +802,7 @@ class ConstructorSignature(Reflection):
         return ReflectionKind.CONSTRUCTOR_SIGNATURE
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Parameter(Reflection):
     type: Type | None = None
     default_value: str | None = None
@@ -558,7 +812,7 @@ class Parameter(Reflection):
         return ReflectionKind.PARAMETER
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class TypeLiteral(Reflection):
     signatures: list[CallSignature] | None = None
     index_signatures: list[IndexSignature] | None = None
@@ -568,7 +822,7 @@ class TypeLiteral(Reflection):
         return ReflectionKind.TYPE_LITERAL
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class TypeParameter(Reflection):
     type: Type | None = None
     default: Type | None = None
@@ -578,7 +832,7 @@ class TypeParameter(Reflection):
         return ReflectionKind.TYPE_PARAMETER
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Accessor(Reflection):
     get_signature: GetSignature | None = None
     set_signature: SetSignature | None = None
@@ -591,7 +845,7 @@ class Accessor(Reflection):
         return ReflectionKind.ACCESSOR
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class GetSignature(Reflection):
     overwrites: Type | None = None
     implementation_of: Type | None = None
@@ -602,7 +856,7 @@ class GetSignature(Reflection):
         return ReflectionKind.GET_SIGNATURE
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class SetSignature(Reflection):
     parameters: list[Parameter] | None = None
     overwrites: Type | None = None
@@ -614,7 +868,7 @@ class SetSignature(Reflection):
         return ReflectionKind.SET_SIGNATURE
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class TypeAlias(Reflection):
     type: Type  # type: ignore[misc]
     type_parameters: list[TypeParameter] | None = None
@@ -625,10 +879,34 @@ class TypeAlias(Reflection):
         return ReflectionKind.TYPE_ALIAS
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Reference(Reflection):
     target: int  # type: ignore[misc]
 
     @property
     def kind(self) -> ReflectionKind:
         return ReflectionKind.REFERENCE
+
+
+# Underlying slots of each reflection class, to set attributes of new reflections without clearing memoized values.
+_parent_slots: dict[type[Reflection], Any] = {}
+_name_slots: dict[type[Reflection], Any] = {}
+
+
+def _wrap_path_slots(cls: type[Reflection]) -> None:
+    _parent_slots[cls] = cls.__dict__["parent"]
+    _name_slots[cls] = cls.__dict__["name"]
+    cls.parent = _PathSlot(_parent_slots[cls])  # type: ignore[assignment]
+    cls.name = _PathSlot(_name_slots[cls])  # type: ignore[assignment]
+
+
+for _cls in Reflection.__subclasses__():
+    # Slotted dataclasses replace the decorated classes, which linger until garbage collected.
+    if "__slots__" in _cls.__dict__:
+        _wrap_path_slots(_cls)
+
+# Fields converted on first access in lazily decoded reflections (see `Reflection.__getattr__`).
+_lazy_fields: dict[type[Reflection], frozenset[str]] = {
+    cls: frozenset(cls_field.name for cls_field in fields(cls) if not cls_field.name.startswith("_"))
+    for cls in _parent_slots
+}
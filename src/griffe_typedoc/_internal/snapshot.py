@@ -0,0 +1,82 @@
+# This module contains a binary snapshot format for decoded projects,
+# much faster to restore than decoding TypeDoc's JSON again.
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import pickle
+import struct
+from pathlib import Path
+from typing import IO, TYPE_CHECKING
+
+from griffe_typedoc._internal import models
+from griffe_typedoc._internal.memory import _gc_paused
+
+if TYPE_CHECKING:
+    from griffe_typedoc._internal.models import Project
+
+_MAGIC = b"GTDSNAP\0"
+_FORMAT_VERSION = 1
+
+
+def _models_digest() -> bytes:
+    # Snapshots store objects attribute by attribute:
+    # they cannot be restored once models gain, lose or rename attributes.
+    digest = hashlib.sha256()
+    for name, obj in sorted(vars(models).items()):
+        if isinstance(obj, type) and dataclasses.is_dataclass(obj):
+            digest.update(f"{name}:{','.join(field.name for field in dataclasses.fields(obj))};".encode())
+    return digest.digest()[:8]
+
+
+# Magic bytes, format version, models digest.
+_HEADER = _MAGIC + struct.pack("<H", _FORMAT_VERSION) + _models_digest()
+
+
+def _write_snapshot(project: Project, file: IO[bytes]) -> None:
+    # Lazily decoded reflections hold their loader, which cannot be pickled: convert them all first.
+    for reflection in list(project.symbol_id_map.values()):
+        reflection._materialize()
+    file.write(_HEADER)
+    pickle.dump(project, file, protocol=5)
+
+
+def _read_snapshot(data: bytes) -> Project:
+    if not data.startswith(_MAGIC):
+        raise ValueError("Not a griffe-typedoc snapshot")
+    if not data.startswith(_HEADER):
+        raise ValueError("Snapshot was saved by an incompatible version of griffe-typedoc")
+    with _gc_paused():
+        return pickle.loads(memoryview(data)[len(_HEADER) :])  # noqa: S301
+
+
+def save_snapshot(project: Project, path: str | Path) -> None:
+    """Save a decoded project as a binary snapshot.
+
+    Snapshots are only meant to be restored by the same version of griffe-typedoc.
+    Never restore snapshots from untrusted sources: they can execute arbitrary code.
+
+    Parameters:
+        project: The project to save.
+        path: Where to save the snapshot.
+    """
+    with Path(path).open("wb") as file:
+        _write_snapshot(project, file)
+
+
+def load_snapshot(source: str | Path | bytes) -> Project:
+    """Restore a project from a binary snapshot.
+
+    Parameters:
+        source: Path to a snapshot saved with [`save_snapshot`][griffe_typedoc.save_snapshot], or its contents.
+
+    Raises:
+        ValueError: When the snapshot is invalid, or was saved by an incompatible version.
+
+    Returns:
+        Top-level project object containing API data.
+    """
+    if isinstance(source, bytes):
+        return _read_snapshot(source)
+    return _read_snapshot(Path(source).read_bytes())
@@ -0,0 +1,94 @@
+# This module contains a cache of source files, used to read the source lines of reflections.
+
+from __future__ import annotations
+
+import os
+from array import array
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class _SourceFile:
+    def __init__(self, path: str) -> None:
+        # Files are read rather than memory-mapped: a mapped file that is truncated
+        # while being edited crashes the process (SIGBUS) when accessed.
+        with open(path, "rb") as file:
+            self.data = file.read()
+        # Offsets of the start of each line, plus the end of the file.
+        self.offsets = array("Q", [0])
+        position = self.data.find(b"\n")
+        while position != -1:
+            self.offsets.append(position + 1)
+            position = self.data.find(b"\n", position + 1)
+        if self.offsets[-1] != len(self.data):
+            self.offsets.append(len(self.data))
+
+    def line(self, lineno: int) -> str:
+        if not 0 < lineno < len(self.offsets):
+            raise IndexError(f"line {lineno} out of range")
+        line = self.data[self.offsets[lineno - 1] : self.offsets[lineno]].decode("utf8")
+        if line.endswith("\r\n"):
+            return line[:-2] + "\n"
+        return line
+
+
+class SourceCache:
+    """Cache of source files, indexed by line.
+
+    Each file is read at most once, and the offsets of its lines are indexed,
+    so that accessing a line is cheap. When the cache holds too many files,
+    least recently used ones are evicted.
+    """
+
+    def __init__(self, max_files: int = 256) -> None:
+        """Initialize the cache.
+
+        Parameters:
+            max_files: Maximum number of files kept in memory.
+        """
+        self.max_files: int = max_files
+        """Maximum number of files kept in memory."""
+        self._files: OrderedDict[str, _SourceFile | None] = OrderedDict()
+
+    def __reduce__(self) -> tuple:
+        # Don't store file contents with pickled projects: they get an empty cache.
+        return (SourceCache, (self.max_files,))
+
+    def line(self, path: str | Path, lineno: int) -> str:
+        """Get a line of a source file.
+
+        Parameters:
+            path: The path of the source file.
+            lineno: The line number, starting at 1.
+
+        Raises:
+            OSError: When the file cannot be read.
+            IndexError: When the line does not exist.
+
+        Returns:
+            The line, with its trailing newline if any.
+        """
+        key = os.path.abspath(path)
+        try:
+            source_file = self._files[key]
+        except KeyError:
+            try:
+                source_file = _SourceFile(key)
+            except OSError:
+                # Remember missing files too, to avoid trying to read them again.
+                source_file = None
+            self._files[key] = source_file
+            if len(self._files) > self.max_files:
+                self._files.popitem(last=False)
+        else:
+            self._files.move_to_end(key)
+        if source_file is None:
+            raise FileNotFoundError(f"cannot read source file {path}")
+        return source_file.line(lineno)
+
+    def clear(self) -> None:
+        """Forget all files."""
+        self._files.clear()
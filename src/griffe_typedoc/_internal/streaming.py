@@ -0,0 +1,173 @@
+# This module contains an incremental JSON parser, used to decode large TypeDoc outputs
+# without holding the whole document in memory.
+
+from __future__ import annotations
+
+import re
+from json import JSONDecodeError
+from json.decoder import scanstring  # type: ignore[attr-defined]
+from typing import IO, Any, Callable
+
+_re_whitespace = re.compile(r"[ \t\n\r]*")
+_re_number = re.compile(r"-?(?:0|[1-9]\d*)(\.\d+)?([eE][-+]?\d+)?")
+_re_number_chars = re.compile(r"[-+.\deE]*")
+
+_LITERALS = {"true": True, "false": False, "null": None}
+
+# Parser states.
+_VALUE = 0  # Expecting any value.
+_ITEM_OR_END = 1  # Expecting an array item or the end of the array.
+_KEY = 2  # Expecting an object key.
+_KEY_OR_END = 3  # Expecting an object key or the end of the object.
+_NEXT_OR_END = 4  # Expecting a comma or the end of the current container.
+
+
+class _StreamParser:
+    def __init__(self, file: IO[str], object_hook: Callable[[dict[str, Any]], Any], chunk_size: int) -> None:
+        self._file = file
+        self._object_hook = object_hook
+        self._chunk_size = chunk_size
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+        chunk = self._file.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        # Drop consumed data.
+        self._buffer = self._buffer[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def _error(self, message: str) -> JSONDecodeError:
+        return JSONDecodeError(message, self._buffer, self._pos)
+
+    def _peek(self) -> str:
+        # Skip whitespace and return the next character without consuming it.
+        while True:
+            self._pos = _re_whitespace.match(self._buffer, self._pos).end()  # type: ignore[union-attr]
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ""
+
+    def _string(self) -> str:
+        # Current character is the opening quote.
+        while True:
+            try:
+                value, end = scanstring(self._buffer, self._pos + 1, True)  # noqa: FBT003
+            except JSONDecodeError:
+                # The string might be cut by the end of the buffer.
+                if self._fill():
+                    continue
+                raise
+            self._pos = end
+            return value
+
+    def _scalar(self) -> Any:
+        while True:
+            char = self._buffer[self._pos]
+            if char in "tfn":
+                if len(self._buffer) - self._pos < 5 and self._fill():  # noqa: PLR2004
+                    continue
+                for literal, value in _LITERALS.items():
+                    if self._buffer.startswith(literal, self._pos):
+                        self._pos += len(literal)
+                        return value
+                raise self._error("Expecting value")
+            # The number might be cut by the end of the buffer.
+            if _re_number_chars.match(self._buffer, self._pos).end() == len(self._buffer) and self._fill():  # type: ignore[union-attr]
+                continue
+            if (match := _re_number.match(self._buffer, self._pos)) is None:
+                raise self._error("Expecting value")
+            integer, fraction, exponent = match.group(), match.group(1), match.group(2)
+            self._pos = match.end()
+            return float(integer) if fraction or exponent else int(integer)
+
+    def parse(self) -> Any:
+        stack: list[dict[str, Any] | list[Any]] = []
+        keys: list[str] = []
+        state = _VALUE
+        while True:
+            char = self._peek()
+            if not char:
+                raise self._error("Unexpected end of document")
+
+            if state in (_KEY, _KEY_OR_END):
+                if char == "}" and state == _KEY_OR_END:
+                    self._pos += 1
+                    keys.pop()
+                    value = self._object_hook(stack.pop())  # type: ignore[arg-type]
+                else:
+                    if char != '"':
+                        raise self._error("Expecting property name enclosed in double quotes")
+                    keys[-1] = self._string()
+                    if self._peek() != ":":
+                        raise self._error("Expecting ':' delimiter")
+                    self._pos += 1
+                    state = _VALUE
+                    continue
+
+            elif state == _NEXT_OR_END:
+                container = stack[-1]
+                if char == ",":
+                    self._pos += 1
+                    state = _KEY if isinstance(container, dict) else _VALUE
+                    continue
+                if char == "}" and isinstance(container, dict):
+                    self._pos += 1
+                    stack.pop()
+                    keys.pop()
+                    value = self._object_hook(container)
+                elif char == "]" and isinstance(container, list):
+                    self._pos += 1
+                    stack.pop()
+                    keys.pop()
+                    value = container
+                else:
+                    raise self._error("Expecting ',' delimiter")
+
+            elif char == "]" and state == _ITEM_OR_END:
+                self._pos += 1
+                keys.pop()
+                value = stack.pop()
+            elif char == "{":
+                self._pos += 1
+                stack.append({})
+                keys.append("")
+                state = _KEY_OR_END
+                continue
+            elif char == "[":
+                self._pos += 1
+                stack.append([])
+                keys.append("")
+                state = _ITEM_OR_END
+                continue
+            elif char == '"':
+                value = self._string()
+            else:
+                value = self._scalar()
+
+            # A value is complete: attach it to its container, or return it.
+            if not stack:
+                if self._peek():
+                    raise self._error("Extra data")
+                return value
+            container = stack[-1]
+            if isinstance(container, dict):
+                container[keys[-1]] = value
+            else:
+                container.append(value)
+            state = _NEXT_OR_END
+
+
+def _parse_stream(
+    file: IO[str],
+    object_hook: Callable[[dict[str, Any]], Any],
+    chunk_size: int = 64 * 1024,
+) -> Any:
+    return _StreamParser(file, object_hook, chunk_size).parse()
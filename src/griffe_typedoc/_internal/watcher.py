@@ -0,0 +1,240 @@
+# This module contains a watcher, reloading projects when their sources change,
+# and patching only the modules that changed.
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from dataclasses import dataclass, field, fields
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import TYPE_CHECKING, Any, Callable
+
+from griffe_typedoc._internal.decoder import TypedocDecoder
+from griffe_typedoc._internal.loader import _double_brackets, _run_typedoc
+from griffe_typedoc._internal.logger import get_logger
+from griffe_typedoc._internal.models import Project, Reflection
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+_logger = get_logger(__name__)
+
+# Project attributes that are patched rather than replaced.
+_PATCHED_ATTRIBUTES = frozenset(("children", "symbol_id_map", "parent"))
+
+
+@dataclass(kw_only=True, slots=True)
+class ChangeSet:
+    """Changes applied to a project after a reload."""
+
+    added: list[Reflection] = field(default_factory=list)
+    """Top-level reflections (usually modules) that were added."""
+    changed: list[Reflection] = field(default_factory=list)
+    """Top-level reflections that changed, as found in the patched project."""
+    removed: list[Reflection] = field(default_factory=list)
+    """Top-level reflections that were removed."""
+    files: list[str] = field(default_factory=list)
+    """Source files that changed."""
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.changed or self.removed)
+
+
+@dataclass(kw_only=True, slots=True)
+class _Entry:
+    # What we remember about each top-level reflection of the project.
+    digest: str
+    ids: list[int]
+
+
+def _iter_reflection_ids(data: Any) -> Iterator[int]:
+    if isinstance(data, dict):
+        if isinstance(data.get("kind"), int) and "id" in data:
+            yield data["id"]
+        for value in data.values():
+            yield from _iter_reflection_ids(value)
+    elif isinstance(data, list):
+        for value in data:
+            yield from _iter_reflection_ids(value)
+
+
+def _entries(data: dict[str, Any]) -> dict[tuple[int, str], _Entry]:
+    # TypeDoc numbers reflections in conversion order: when ids shift,
+    # the JSON of the following modules changes too, and they are patched as well.
+    return {
+        (child["kind"], child["name"]): _Entry(
+            digest=hashlib.sha256(json.dumps(child, sort_keys=True).encode()).hexdigest(),
+            ids=list(_iter_reflection_ids(child)),
+        )
+        for child in data.get("children", ())
+    }
+
+
+class ProjectWatcher:
+    """Watch the sources of a project, and patch it when they change.
+
+    The watched files are the ones listed in the project's file registry.
+    When one of them changes, TypeDoc runs again, and top-level reflections
+    (usually modules) whose data changed are replaced in the existing project.
+    Unchanged reflections are kept as is, so that objects referencing them stay valid.
+    """
+
+    def __init__(
+        self,
+        typedoc_command: str | list[str],
+        working_directory: str = ".",
+        *,
+        interval: float = 1.0,
+    ) -> None:
+        """Initialize the watcher.
+
+        Parameters:
+            typedoc_command: Name/path of the `typedoc` executable, or a command as list.
+            working_directory: Where to execute the command.
+            interval: Time between checks, in seconds.
+        """
+        self.typedoc_command: str | list[str] = typedoc_command
+        """The TypeDoc command."""
+        self.working_directory: str = working_directory
+        """Where to execute the command."""
+        self.interval: float = interval
+        """Time between checks, in seconds."""
+        self.project: Project | None = None
+        """The watched project, loaded on first check."""
+        self._entries: dict[tuple[int, str], _Entry] = {}
+        self._stats: dict[str, tuple[int, int] | None] = {}
+
+    def load(self) -> Project:
+        """Load the project, and start watching its sources.
+
+        Returns:
+            Top-level project object containing API data.
+        """
+        self.project = None
+        self.check()
+        return self.project  # type: ignore[return-value]
+
+    def check(self) -> ChangeSet | None:
+        """Check sources once, and patch the project if they changed.
+
+        Raises:
+            RuntimeError: When TypeDoc fails while loading the project for the first time.
+            ValueError: When TypeDoc's output is not valid JSON, while loading the project for the first time.
+
+        Returns:
+            The changes, or none if sources did not change (or the project could not be reloaded).
+        """
+        if self.project is not None:
+            changed_files = [path for path, stat in self._stat_files().items() if stat != self._stats.get(path)]
+            if not changed_files:
+                return None
+            _logger.debug(f"Sources changed: {', '.join(changed_files)}")
+        else:
+            changed_files = []
+
+        try:
+            data = self._run_typedoc()
+        except (RuntimeError, ValueError) as error:
+            if self.project is None:
+                raise
+            # TypeDoc writes no output while sources have errors, which is frequent while they are being edited:
+            # keep the current project, and try again on the next change.
+            _logger.warning(f"Could not reload project, keeping the current one: {_double_brackets(str(error))}")
+            self._stats = self._stat_files()
+            return None
+        entries = _entries(data)
+        project = TypedocDecoder().convert(data)
+
+        if self.project is None:
+            self.project = project
+            changes = ChangeSet(added=list(project.children))
+        else:
+            changes = self._patch(project, entries)
+        changes.files = changed_files
+        self._entries = entries
+        self._stats = self._stat_files()
+        return changes
+
+    def watch(self, callback: Callable[[ChangeSet], Any], stop: threading.Event | None = None) -> None:
+        """Check sources periodically, until stopped.
+
+        Parameters:
+            callback: A function called with the changes, each time the project is patched.
+            stop: An event to set to stop watching. Default: watch forever.
+        """
+        stop = stop or threading.Event()
+        if self.project is None:
+            self.load()
+        while not stop.wait(self.interval):
+            if changes := self.check():
+                callback(changes)
+
+    def _run_typedoc(self) -> Any:
+        # Run TypeDoc, and return its parsed JSON output.
+        with NamedTemporaryFile("rb") as tmpfile:
+            returncode = _run_typedoc(self.typedoc_command, self.working_directory, tmpfile.name)
+            contents = Path(tmpfile.name).read_bytes()
+        if returncode:
+            raise RuntimeError(f"TypeDoc exited with code {returncode}")
+        return json.loads(contents)
+
+    def _stat_files(self) -> dict[str, tuple[int, int] | None]:
+        stats: dict[str, tuple[int, int] | None] = {}
+        if self.project is None or self.project.files is None:
+            return stats
+        for filepath in self.project.files.entries.values():
+            path = os.path.join(self.working_directory, filepath)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                stats[path] = None
+            else:
+                stats[path] = (stat.st_mtime_ns, stat.st_size)
+        return stats
+
+    def _patch(self, new: Project, entries: dict[tuple[int, str], _Entry]) -> ChangeSet:
+        project: Project = self.project  # type: ignore[assignment]
+        changes = ChangeSet()
+        old_children = {(child.kind.to_int(), child.name): child for child in project.children}
+        symbol_map = dict(new.symbol_id_map)
+        symbol_map[new.id] = project
+        children = []
+        for new_child in new.children:
+            key = (new_child.kind.to_int(), new_child.name)
+            old_entry = self._entries.get(key)
+            if old_entry is not None and old_entry.digest == entries[key].digest and key in old_children:
+                # Same data, same ids: keep the existing objects.
+                old_child = old_children.pop(key)
+                for reflection_id in old_entry.ids:
+                    symbol_map[reflection_id] = project.symbol_id_map[reflection_id]
+                children.append(old_child)
+                continue
+            if old_children.pop(key, None) is None:
+                changes.added.append(new_child)
+            else:
+                changes.changed.append(new_child)
+            children.append(new_child)
+        changes.removed = list(old_children.values())
+
+        # Move new objects into the existing project.
+        for reflection in new.symbol_id_map.values():
+            if symbol_map.get(reflection.id) is reflection:
+                reflection.project = project
+        for child in changes.added + changes.changed:
+            child.parent = project
+        project.children = children
+        project.symbol_id_map.clear()
+        project.symbol_id_map.update(symbol_map)
+        for project_field in fields(Project):
+            if project_field.init and project_field.name not in _PATCHED_ATTRIBUTES:
+                setattr(project, project_field.name, getattr(new, project_field.name))
+        project.source_cache.clear()
+        project._clear_indexes()
+        project._references = None
+        _logger.debug(
+            f"Patched project: {len(changes.added)} added, {len(changes.changed)} changed, {len(changes.removed)} removed",
+        )
+        return changes
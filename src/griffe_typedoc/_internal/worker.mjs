@@ -0,0 +1,46 @@
+// Long-lived TypeDoc process, driven by griffe-typedoc over stdin/stdout.
+//
+// Usage: node worker.mjs [TYPEDOC_OPTIONS...]
+//
+// Each line read on stdin is a JSON request: {"id": 1, "json": "/path/to/output.json"}.
+// For each request, the project is converted again and written to the given path,
+// then a JSON response is written on stdout: {"id": 1, "error": null}.
+// Any other output (TypeDoc logs) is forwarded as is.
+// The worker exits when stdin is closed.
+
+import { createRequire } from "node:module";
+import { createInterface } from "node:readline";
+import { pathToFileURL } from "node:url";
+
+// Resolve TypeDoc from the working directory, like `npx typedoc` would.
+const require = createRequire(pathToFileURL(`${process.cwd()}/`));
+const typedoc = await import(pathToFileURL(require.resolve("typedoc")).href);
+
+const args = process.argv.slice(2);
+const app = await typedoc.Application.bootstrapWithPlugins({}, [
+  new typedoc.ArgumentsReader(0, args),
+  new typedoc.TypeDocReader(),
+  new typedoc.PackageJsonReader(),
+  new typedoc.TSConfigReader(),
+  new typedoc.ArgumentsReader(300, args),
+]);
+
+function respond(id, error) {
+  process.stdout.write(`${JSON.stringify({ id, error })}\n`);
+}
+
+for await (const line of createInterface({ input: process.stdin })) {
+  if (!line.trim()) continue;
+  const request = JSON.parse(line);
+  try {
+    const project = await app.convert();
+    if (!project) {
+      respond(request.id, "conversion failed");
+      continue;
+    }
+    await app.generateJson(project, request.json);
+    respond(request.id, null);
+  } catch (error) {
+    respond(request.id, String(error));
+  }
+}
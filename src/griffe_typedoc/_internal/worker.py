@@ -0,0 +1,151 @@
+# This module contains a long-lived TypeDoc process, to convert projects repeatedly
+# without paying Node.js and TypeDoc startup times on each load.
+
+from __future__ import annotations
+
+import json
+import subprocess
+import threading
+from contextlib import suppress
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import TYPE_CHECKING, Any
+
+from griffe_typedoc._internal.loader import _log_typedoc_line, _typedoc_env, load_json
+from griffe_typedoc._internal.logger import get_logger
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from griffe_typedoc._internal.models import Project
+
+_logger = get_logger(__name__)
+
+_WORKER_SCRIPT = Path(__file__).with_name("worker.mjs")
+
+
+class TypedocWorker:
+    """Long-lived TypeDoc process, converting the project on demand.
+
+    The worker is started on first use (or after it died), and kept alive
+    until [`close`][griffe_typedoc.TypedocWorker.close] is called.
+    It reads JSON requests on its standard input, one per line, and answers
+    with JSON responses on its standard output. Other output lines are logged.
+    """
+
+    def __init__(
+        self,
+        working_directory: str = ".",
+        *,
+        typedoc_options: list[str] | None = None,
+        command: list[str] | None = None,
+    ) -> None:
+        """Initialize the worker.
+
+        Parameters:
+            working_directory: Where to run TypeDoc.
+            typedoc_options: Additional TypeDoc command line options.
+            command: The command starting the worker. Default: our `worker.mjs` script, run with `node`.
+        """
+        self.working_directory: str = working_directory
+        """Where to run TypeDoc."""
+        self.command: list[str] = [*(command or ["node", str(_WORKER_SCRIPT)]), *(typedoc_options or ())]
+        """The command starting the worker."""
+        self._process: subprocess.Popen | None = None
+        self._request_id = 0
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> TypedocWorker:  # noqa: PYI034
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    @property
+    def running(self) -> bool:
+        """Whether the worker process is running."""
+        return self._process is not None and self._process.poll() is None
+
+    def start(self) -> None:
+        """Start the worker process, if it is not running already."""
+        with self._lock:
+            self._start()
+
+    def _start(self) -> None:
+        if self.running:
+            return
+        _logger.debug(f"Starting TypeDoc worker in {self.working_directory}")
+        self._process = subprocess.Popen(  # noqa: S603
+            self.command,
+            text=True,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            cwd=self.working_directory,
+            env=_typedoc_env(),
+        )
+
+    def load(self) -> Project:
+        """Convert the project with the worker, and load it.
+
+        Raises:
+            RuntimeError: When the worker died or failed to convert the project.
+
+        Returns:
+            Top-level project object containing API data.
+        """
+        with self._lock, NamedTemporaryFile("r+") as tmpfile:
+            self._start()
+            self._request_id += 1
+            response = self._request({"id": self._request_id, "json": tmpfile.name})
+            if error := response.get("error"):
+                raise RuntimeError(f"TypeDoc worker failed to convert the project: {error}")
+            return load_json(tmpfile.name)
+
+    def _request(self, request: dict[str, Any]) -> dict[str, Any]:
+        process: subprocess.Popen = self._process  # type: ignore[assignment]
+        try:
+            process.stdin.write(json.dumps(request) + "\n")  # type: ignore[union-attr]
+            process.stdin.flush()  # type: ignore[union-attr]
+        except BrokenPipeError:
+            self._stop()
+            raise RuntimeError("TypeDoc worker exited unexpectedly") from None
+        # Log output until the worker answers our request.
+        for line in process.stdout:  # type: ignore[union-attr]
+            if not (line := line.strip()):
+                continue
+            if line.startswith("{"):
+                try:
+                    response = json.loads(line)
+                except json.JSONDecodeError:
+                    pass
+                else:
+                    if isinstance(response, dict) and response.get("id") == request["id"]:
+                        return response
+            _log_typedoc_line(line)
+        self._stop()
+        raise RuntimeError("TypeDoc worker exited unexpectedly")
+
+    def close(self) -> None:
+        """Stop the worker process."""
+        with self._lock:
+            self._stop()
+
+    def _stop(self) -> None:
+        if self._process is None:
+            return
+        process, self._process = self._process, None
+        # Closing its input tells the worker to exit.
+        with suppress(BrokenPipeError):
+            process.stdin.close()  # type: ignore[union-attr]
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+        process.stdout.close()  # type: ignore[union-attr]
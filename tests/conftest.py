@@ -1 +1,29 @@
 """Configuration for the pytest test suite."""
+
+from __future__ import annotations
+
+import shutil
+import sys
+from typing import TYPE_CHECKING
+
+import pytest
+
+from tests import FIXTURES_DIR
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+FAKE_TYPEDOC = [sys.executable, str(FIXTURES_DIR / "fake_typedoc.py")]
+
+
+@pytest.fixture(name="project_dir")
+def _fixture_project_dir(tmp_path: Path) -> Path:
+    return shutil.copytree(FIXTURES_DIR / "project", tmp_path / "project")
+
+
+@pytest.fixture(name="calls_file")
+def _fixture_calls_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    # Fake TypeDoc executables record their arguments in this file.
+    calls_file = tmp_path / "calls.txt"
+    monkeypatch.setenv("FAKE_TYPEDOC_CALLS", str(calls_file))
+    return calls_file
@@ -0,0 +1,21 @@
+"""Stand-in for the `typedoc` executable, writing a pre-generated JSON output."""
+
+import os
+import sys
+from pathlib import Path
+
+if exit_code := os.environ.get("FAKE_TYPEDOC_EXIT_CODE"):
+    # Like TypeDoc when sources have errors: no output is written.
+    print("[error] Found 1 error")
+    sys.exit(int(exit_code))
+
+output = Path(sys.argv[sys.argv.index("--json") + 1])
+# Not `shutil.copyfile`, which refuses to write into pipes (`/dev/fd/N`).
+output.write_bytes(Path(os.environ.get("FAKE_TYPEDOC_OUTPUT") or Path(__file__).parent / "project.json").read_bytes())
+
+if calls_file := os.environ.get("FAKE_TYPEDOC_CALLS"):
+    with open(calls_file, "a") as file:
+        file.write(" ".join(sys.argv[1:]) + "\n")
+
+print("[warning] Some symbols are not exported")
+print(f"[info] JSON written to {output}")
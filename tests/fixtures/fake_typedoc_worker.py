@@ -0,0 +1,22 @@
+"""Stand-in for the TypeDoc worker script, writing a pre-generated JSON output on each request."""
+
+import json
+import os
+import shutil
+import sys
+from pathlib import Path
+
+if calls_file := os.environ.get("FAKE_TYPEDOC_CALLS"):
+    with open(calls_file, "a") as file:
+        file.write(" ".join(sys.argv[1:]) + "\n")
+
+for line in sys.stdin:
+    request = json.loads(line)
+    if "--fail" in sys.argv:
+        print(json.dumps({"id": request["id"], "error": "Found 1 error"}), flush=True)
+        continue
+    if "--crash" in sys.argv:
+        sys.exit(1)
+    shutil.copyfile(Path(__file__).parent / "project.json", request["json"])
+    print("[warning] Some symbols are not exported")
+    print(json.dumps({"id": request["id"], "error": None}), flush=True)
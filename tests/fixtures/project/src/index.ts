@@ -0,0 +1,54 @@
+/**
+ * Geometry helpers.
+ *
+ * @packageDocumentation
+ */
+
+export { add as sum } from "./utils";
+
+/** A point in a two-dimensional space. */
+export interface Point {
+  /** Horizontal coordinate. */
+  x: number;
+  /** Vertical coordinate. */
+  y: number;
+}
+
+/** The available shape kinds. */
+export enum ShapeKind {
+  Circle,
+  Square,
+}
+
+/**
+ * A shape anchored at a {@link Point}.
+ */
+export class Shape {
+  /** Where the shape is anchored. */
+  origin: Point;
+
+  constructor(origin: Point) {
+    this.origin = origin;
+  }
+
+  /** The shape's label. */
+  get label(): string {
+    return "shape";
+  }
+
+  /**
+   * Move the shape.
+   *
+   * @param dx - Horizontal offset.
+   * @returns The moved shape.
+   */
+  move(dx: number): Shape {
+    return new Shape({ x: this.origin.x + dx, y: this.origin.y });
+  }
+}
+
+/** A shape identifier. */
+export type ShapeId<T> = string | T;
+
+/** The origin of the plane. */
+export const ORIGIN: Point = { x: 0, y: 0 };
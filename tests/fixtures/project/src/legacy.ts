@@ -0,0 +1,8 @@
+import { add } from "./utils";
+
+/** CommonJS-style exports. */
+declare function legacy(): {
+  add: typeof add;
+};
+
+export = legacy;
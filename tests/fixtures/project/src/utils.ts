@@ -0,0 +1,15 @@
+/**
+ * Add two numbers.
+ *
+ * @param a - First number.
+ * @param b - Second number.
+ * @returns The sum.
+ */
+export function add(a: number, b: number): number {
+  return a + b;
+}
+
+/** Wait for a bit. */
+export async function sleep(ms: number): Promise<void> {
+  await new Promise((resolve) => setTimeout(resolve, ms));
+}
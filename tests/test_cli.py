@@ -6,6 +6,7 @@ import pytest
 
 from griffe_typedoc import main
 from griffe_typedoc._internal import debug
+from tests import FIXTURES_DIR
 
 
 def test_main() -> None:
@@ -50,3 +51,16 @@ def test_show_debug_info(capsys: pytest.CaptureFixture) -> None:
     assert "system" in captured
     assert "environment" in captured
     assert "packages" in captured
+
+
+@pytest.mark.parametrize("mmap", [False, True])
+def test_load_json(capsys: pytest.CaptureFixture, mmap: bool) -> None:
+    """Load API data from a JSON file.
+
+    Parameters:
+        capsys: Pytest fixture to capture output.
+        mmap: Whether to memory-map the file.
+    """
+    assert main(["--json", str(FIXTURES_DIR / "project.json"), *(["--mmap"] if mmap else [])]) == 0
+    captured = capsys.readouterr()
+    assert captured.out == "geometry 1.0.0 (35 symbols)\n"
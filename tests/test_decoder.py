@@ -0,0 +1,157 @@
+"""Tests for the decoder."""
+
+from __future__ import annotations
+
+import importlib.util
+import io
+import json
+from typing import Any
+
+import pytest
+
+from griffe_typedoc import BlockTagKind, ReflectionKind, TypedocDecoder, load_json
+from tests import FIXTURES_DIR, TESTS_DIR
+
+PROJECT_JSON = FIXTURES_DIR / "project.json"
+SCRIPTS_DIR = TESTS_DIR.parent / "scripts"
+
+
+@pytest.mark.parametrize(
+    "document",
+    [
+        '{"a": [1, 2.5, -3e2, 1.25E-3, -0, true, false, null], "b": {}, "c": []}',
+        '"\\u00e9\\"quoted\\" \\\\ \\n"',
+        "  [ { } , [ ] , 12 ]  ",
+        "0",
+    ],
+)
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 1024])
+def test_stream_plain_json(document: str, chunk_size: int) -> None:
+    """Streaming decoding handles values cut at any position."""
+    decoder = TypedocDecoder()
+    assert decoder.decode_stream(io.StringIO(document), chunk_size=chunk_size) == json.loads(document)
+
+
+@pytest.mark.parametrize("document", ["", "{", "[1,]", '{"a" 1}', "[1 2]", "tru", "{} []", "[01]", "[1.]", '{"a":1,}'])
+@pytest.mark.parametrize("chunk_size", [1, 4, 1024])
+def test_stream_invalid_json(document: str, chunk_size: int) -> None:
+    """Streaming decoding rejects invalid documents."""
+    with pytest.raises(json.JSONDecodeError):
+        TypedocDecoder().decode_stream(io.StringIO(document), chunk_size=chunk_size)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 100, 64 * 1024])
+def test_stream_project(chunk_size: int) -> None:
+    """Streaming decoding gives the same project as standard decoding."""
+    expected = json.loads(PROJECT_JSON.read_text(), cls=TypedocDecoder)
+    with PROJECT_JSON.open() as file:
+        project = TypedocDecoder().decode_stream(file, chunk_size=chunk_size)
+    assert repr(project) == repr(expected)
+    assert project.symbol_id_map[16].parent is project.symbol_id_map[15]
+
+
+def test_generated_loaders_are_up_to_date() -> None:
+    """The loaders module matches its schema."""
+    spec = importlib.util.spec_from_file_location("gen_decoder", SCRIPTS_DIR / "gen_decoder.py")
+    gen_decoder = importlib.util.module_from_spec(spec)  # type: ignore[arg-type]
+    spec.loader.exec_module(gen_decoder)  # type: ignore[union-attr]
+    assert gen_decoder.OUTPUT_PATH.read_text(encoding="utf8") == gen_decoder.generate()
+
+
+def test_decode_ignores_unknown_keys() -> None:
+    """Keys added by future TypeDoc versions are ignored."""
+    source = json.loads('{"fileName": "a.ts", "line": 1, "character": 0, "someFutureKey": true}', cls=TypedocDecoder)
+    assert source.file_name == "a.ts"
+
+
+@pytest.mark.parametrize("kind", list(ReflectionKind))
+def test_reflection_kind_int_round_trip(kind: ReflectionKind) -> None:
+    """Reflection kinds convert to and from TypeDoc's integer values."""
+    assert ReflectionKind.from_int(kind.to_int()) is kind
+
+
+@pytest.mark.parametrize("tag", list(BlockTagKind))
+def test_decode_block_tags(tag: BlockTagKind) -> None:
+    """All block tags are decoded."""
+    block_tag = json.loads(
+        json.dumps({"tag": tag.value, "content": [{"kind": "text", "text": "x"}]}),
+        cls=TypedocDecoder,
+    )
+    assert block_tag.kind is tag
+    assert str(block_tag) == "x"
+
+
+def test_share_identical_types() -> None:
+    """Identical intrinsic and literal types are decoded once, other types are not shared."""
+    types = json.loads(
+        json.dumps(
+            [
+                {"type": "intrinsic", "name": "string"},
+                {"type": "intrinsic", "name": "string"},
+                {"type": "literal", "value": True},
+                {"type": "literal", "value": True},
+                {"type": "literal", "value": 1},
+                {"type": "literal", "value": {"value": "1", "negative": False}},
+                {"type": "literal", "value": {"value": "1", "negative": False}},
+                {"type": "reference", "name": "Shape", "target": 5},
+                {"type": "reference", "name": "Shape", "target": 5},
+            ],
+        ),
+        cls=TypedocDecoder,
+    )
+    assert types[0] is types[1]
+    assert types[2] is types[3]
+    assert types[4] is not types[2]
+    assert types[4].value == 1
+    assert types[5] is not types[6]
+    assert types[7] is not types[8]
+
+
+def test_intern_strings() -> None:
+    """Repeated strings are interned."""
+    with PROJECT_JSON.open() as file:
+        project = TypedocDecoder().decode_stream(file)
+    add, sleep = project.symbol_id_map[24], project.symbol_id_map[28]
+    assert add.variant is sleep.variant
+    assert add.sources[0].file_name is sleep.sources[0].file_name
+
+
+def _expected_parents(data: Any, parents: dict[int, int | None]) -> None:
+    # Parents as described by the raw document: only some keys hold a reflection's children.
+    if isinstance(data, dict):
+        if isinstance(data.get("kind"), int):
+            parents.setdefault(data["id"], None)
+            for key in ("children", "signatures", "parameters", "getSignature", "setSignature"):
+                value = data.get(key)
+                for child in value if isinstance(value, list) else [value] if value else []:
+                    parents[child["id"]] = data["id"]
+        for value in data.values():
+            _expected_parents(value, parents)
+    elif isinstance(data, list):
+        for value in data:
+            _expected_parents(value, parents)
+
+
+@pytest.mark.parametrize("method", ["decode", "decode_stream", "convert", "lazy"])
+def test_parents(method: str) -> None:
+    """Every decoding method links reflections to the parents described by the document."""
+    expected: dict[int, int | None] = {}
+    _expected_parents(json.loads(PROJECT_JSON.read_text()), expected)
+    if method == "decode":
+        project = json.loads(PROJECT_JSON.read_text(), cls=TypedocDecoder)
+    elif method == "decode_stream":
+        with PROJECT_JSON.open() as file:
+            project = TypedocDecoder().decode_stream(file)
+    elif method == "convert":
+        project = TypedocDecoder().convert(json.loads(PROJECT_JSON.read_text()))
+    else:
+        project = load_json(PROJECT_JSON, lazy=True)
+
+    reflections = {project.id: project, **project.symbol_id_map}
+    parents = {
+        id_: None if reflection.parent is None else reflection.parent.id for id_, reflection in reflections.items()
+    }
+    assert parents == expected
+    for reflection in reflections.values():
+        assert reflection.project is (None if reflection is project else project)
+        assert all(source.parent is reflection for source in reflection.sources)
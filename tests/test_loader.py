@@ -0,0 +1,254 @@
+"""Tests for the loader."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import shutil
+import sys
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from griffe_typedoc import Project, ProjectCache, load, load_async, load_json, load_many
+from tests import FIXTURES_DIR
+from tests.conftest import FAKE_TYPEDOC
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+SLOW_TYPEDOC = [sys.executable, "-c", "import time; print('[info] Converting', flush=True); time.sleep(30)"]
+
+
+def _calls(calls_file: Path) -> int:
+    return len(calls_file.read_text().splitlines()) if calls_file.exists() else 0
+
+
+def test_load(project_dir: Path) -> None:
+    """Load a project by running TypeDoc."""
+    project = load(FAKE_TYPEDOC, working_directory=str(project_dir))
+    assert isinstance(project, Project)
+    assert [module.name for module in project.children] == ["index", "legacy", "utils"]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="no /dev/fd")
+@pytest.mark.parametrize("shell", [False, True])
+def test_load_through_pipe(project_dir: Path, caplog: pytest.LogCaptureFixture, shell: bool) -> None:
+    """Load a project with TypeDoc writing its JSON output to a pipe, and its logs to another."""
+    command = " ".join(FAKE_TYPEDOC) if shell else FAKE_TYPEDOC
+    with caplog.at_level(logging.DEBUG):
+        project = load(command, working_directory=str(project_dir), pipe=True)
+    assert [module.name for module in project.children] == ["index", "legacy", "utils"]
+    assert "JSON written to /dev/fd/" in caplog.text
+
+
+def test_load_through_pipe_fallback(project_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Fall back to a temporary file when `/dev/fd` is not available."""
+    monkeypatch.setattr(os.path, "isdir", lambda path: False)
+    project = load(FAKE_TYPEDOC, working_directory=str(project_dir), pipe=True)
+    assert len(project.symbol_id_map) == 35
+
+
+@pytest.mark.parametrize("memory_map", [False, True])
+def test_load_json_file(memory_map: bool) -> None:
+    """Load a project from a TypeDoc JSON file."""
+    project = load_json(FIXTURES_DIR / "project.json", memory_map=memory_map)
+    assert project.package_name == "geometry"
+    assert len(project.symbol_id_map) == 35
+
+
+@pytest.mark.parametrize("memory_map", [False, True])
+def test_load_json_empty_file(tmp_path: Path, memory_map: bool) -> None:
+    """Empty files fail to decode, whether memory-mapped or not."""
+    empty = tmp_path / "empty.json"
+    empty.touch()
+    with pytest.raises(json.JSONDecodeError):
+        load_json(empty, memory_map=memory_map)
+
+
+def test_load_json_bytes() -> None:
+    """Load a project from TypeDoc JSON contents."""
+    project = load_json(FIXTURES_DIR.joinpath("project.json").read_bytes())
+    assert project.symbol_id_map[5].name == "Shape"
+
+
+def test_load_json_bytes_streaming() -> None:
+    """Contents can be decoded in streaming mode too."""
+    contents = FIXTURES_DIR.joinpath("project.json").read_bytes()
+    assert repr(load_json(contents, streaming=True)) == repr(load_json(contents))
+
+
+@pytest.mark.parametrize("backend", ["json", "orjson", "msgspec"])
+@pytest.mark.parametrize("lazy", [False, True])
+def test_load_json_backends(backend: str, lazy: bool) -> None:
+    """Every backend decodes projects like the standard library."""
+    if backend != "json":
+        pytest.importorskip(backend)
+    contents = FIXTURES_DIR.joinpath("project.json").read_bytes()
+    assert repr(load_json(contents, backend=backend, lazy=lazy)) == repr(load_json(contents))
+
+
+def test_load_json_unknown_backend() -> None:
+    """Unknown backends are rejected."""
+    with pytest.raises(ValueError, match="Unknown JSON backend 'simdjson'"):
+        load_json(FIXTURES_DIR / "project.json", backend="simdjson")
+    with pytest.raises(ValueError, match="only supports the 'json' backend"):
+        load_json(FIXTURES_DIR / "project.json", backend="orjson", streaming=True)
+
+
+def test_load_json_lazy() -> None:
+    """Lazily loaded projects convert reflections on access, like eager ones."""
+    contents = FIXTURES_DIR.joinpath("project.json").read_bytes()
+    project = load_json(contents, lazy=True)
+    shape = project.symbol_id_map[5]
+    assert shape._lazy is not None
+    assert shape.path == "index/Shape"
+    move = project.symbol_id_map[15]
+    assert move.path == "index/Shape/move"
+    assert shape._lazy is not None
+    assert [child.name for child in shape.children] == ["constructor", "origin", "label", "move"]
+    assert shape._lazy is None
+    # Converting reflections does not invalidate memoized paths.
+    assert move._path == "index/Shape/move"
+    assert project.symbol_id_map[34].name == "add"
+    assert project.source_cache is not None
+    assert repr(project) == repr(load_json(contents))
+
+
+def test_load_json_lazy_streaming() -> None:
+    """Lazy and streaming decoding cannot be combined."""
+    with pytest.raises(ValueError, match="cannot be combined"):
+        load_json(FIXTURES_DIR / "project.json", lazy=True, streaming=True)
+
+
+def test_load_from_cache(project_dir: Path, calls_file: Path, tmp_path: Path) -> None:
+    """Unchanged inputs are loaded from the cache without running TypeDoc."""
+    cache = ProjectCache(tmp_path / "cache")
+    first = load(FAKE_TYPEDOC, working_directory=str(project_dir), cache=cache)
+    second = load(FAKE_TYPEDOC, working_directory=str(project_dir), cache=cache)
+    assert _calls(calls_file) == 1
+    assert second.name == first.name
+    assert sorted(second.symbol_id_map) == sorted(first.symbol_id_map)
+    assert second.symbol_id_map[5].parent is second.children[0]
+
+
+@pytest.mark.parametrize("changed_file", ["src/index.ts", "typedoc.json", "package-lock.json"])
+def test_changed_inputs_invalidate_cache(
+    project_dir: Path,
+    calls_file: Path,
+    tmp_path: Path,
+    changed_file: str,
+) -> None:
+    """Changing sources, configuration or lockfiles invalidates the cache."""
+    cache = ProjectCache(tmp_path / "cache")
+    load(FAKE_TYPEDOC, working_directory=str(project_dir), cache=cache)
+    with project_dir.joinpath(changed_file).open("a") as file:
+        file.write("\n")
+    load(FAKE_TYPEDOC, working_directory=str(project_dir), cache=cache)
+    assert _calls(calls_file) == 2
+
+
+def test_changed_parent_config_invalidates_cache(project_dir: Path, calls_file: Path, tmp_path: Path) -> None:
+    """Changing a configuration shared by the packages of a monorepo invalidates the cache."""
+    cache = ProjectCache(tmp_path / "cache")
+    base_config = tmp_path / "tsconfig.base.json"
+    base_config.write_text("{}")
+    load(FAKE_TYPEDOC, working_directory=str(project_dir), cache=cache)
+    base_config.write_text('{"compilerOptions": {"strict": true}}')
+    load(FAKE_TYPEDOC, working_directory=str(project_dir), cache=cache)
+    assert _calls(calls_file) == 2
+
+
+def test_build_outputs_do_not_invalidate_cache(project_dir: Path, calls_file: Path, tmp_path: Path) -> None:
+    """Build outputs are not TypeDoc inputs."""
+    cache = ProjectCache(tmp_path / "cache")
+    load(FAKE_TYPEDOC, working_directory=str(project_dir), cache=cache)
+    for directory in ("dist", "site"):
+        project_dir.joinpath(directory).mkdir()
+        project_dir.joinpath(directory, "index.js").write_text("export {};\n")
+    load(FAKE_TYPEDOC, working_directory=str(project_dir), cache=cache)
+    assert _calls(calls_file) == 1
+
+
+def test_invalidate_cache(project_dir: Path, calls_file: Path, tmp_path: Path) -> None:
+    """Entries can be removed explicitly."""
+    cache = ProjectCache(tmp_path / "cache")
+    load(FAKE_TYPEDOC, working_directory=str(project_dir), cache=cache)
+    cache.invalidate(cache.fingerprint(FAKE_TYPEDOC, str(project_dir)))
+    load(FAKE_TYPEDOC, working_directory=str(project_dir), cache=cache)
+    cache.invalidate()
+    load(FAKE_TYPEDOC, working_directory=str(project_dir), cache=cache)
+    assert _calls(calls_file) == 3
+
+
+def test_cache_eviction(project_dir: Path, tmp_path: Path) -> None:
+    """Least recently used entries are evicted when the cache is full."""
+    cache = ProjectCache(tmp_path / "cache")
+    project = load(FAKE_TYPEDOC, working_directory=str(project_dir))
+    cache.set("a", project)
+    entry_size = cache._path("a").stat().st_size
+    cache.max_size = entry_size * 2
+    cache.set("b", project)
+    assert cache.get("a") is not None
+    cache.set("c", project)
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    assert cache.get("c") is not None
+
+
+def test_cache_eviction_race(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Entries evicted concurrently by another thread or process are skipped."""
+    cache = ProjectCache(tmp_path / "cache", max_size=0)
+    entries = cache._entries
+    monkeypatch.setattr(cache, "_entries", lambda: [*entries(), cache._path("evicted")])
+    cache.set("a", load_json(FIXTURES_DIR / "project.json"))
+    assert cache.get("a") is None
+
+
+def test_load_many(project_dir: Path, tmp_path: Path, calls_file: Path) -> None:
+    """Load several packages concurrently, skipping the ones that fail."""
+    other_dir = shutil.copytree(project_dir, tmp_path / "other")
+    missing_dir = tmp_path / "missing"
+    projects = load_many(FAKE_TYPEDOC, [str(project_dir), str(missing_dir), str(other_dir)], max_workers=2)
+    assert list(projects) == [str(project_dir), str(other_dir)]
+    assert all(project.symbol_id_map[16].parent is project.symbol_id_map[15] for project in projects.values())
+    assert _calls(calls_file) == 2
+
+
+def test_load_async(project_dir: Path, calls_file: Path, tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    """Load a project from an event loop."""
+    cache = ProjectCache(tmp_path / "cache")
+    caplog.set_level("INFO")
+    for _ in range(2):
+        project = asyncio.run(load_async(FAKE_TYPEDOC, working_directory=str(project_dir), cache=cache))
+        assert project.symbol_id_map[16].parent is project.symbol_id_map[15]
+    assert _calls(calls_file) == 1
+    assert "Some symbols are not exported" in caplog.text
+
+
+def test_load_async_timeout(project_dir: Path) -> None:
+    """TypeDoc is stopped when it takes too long."""
+    start = time.monotonic()
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(load_async(SLOW_TYPEDOC, working_directory=str(project_dir), timeout=0.5))
+    assert time.monotonic() - start < 10
+
+
+def test_load_async_cancel(project_dir: Path, caplog: pytest.LogCaptureFixture) -> None:
+    """TypeDoc is stopped when loading is cancelled."""
+    caplog.set_level("INFO")
+
+    async def cancel() -> None:
+        task = asyncio.create_task(load_async(SLOW_TYPEDOC, working_directory=str(project_dir)))
+        while "Converting" not in caplog.text:
+            await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    start = time.monotonic()
+    asyncio.run(cancel())
+    assert time.monotonic() - start < 10
@@ -0,0 +1,199 @@
+"""Tests for the models."""
+
+from __future__ import annotations
+
+import json
+from dataclasses import fields
+
+import pytest
+
+from griffe_typedoc import Group, Project, Reflection, load_json
+from griffe_typedoc._internal.lazy import _reflection_classes
+from griffe_typedoc._internal.models import _PathSlot
+from tests import FIXTURES_DIR
+
+
+@pytest.fixture(name="project", scope="module")
+def _fixture_project() -> Project:
+    return load_json(FIXTURES_DIR / "project.json")
+
+
+def test_models_are_slotted(project: Project) -> None:
+    """Decoded objects do not carry a `__dict__`."""
+    shape = project.symbol_id_map[5]
+    objects = [project, shape, shape.comment, shape.comment.summary[0], shape.sources[0], project.files]  # type: ignore[union-attr]
+    objects.append(project.symbol_id_map[9].type)
+    for obj in objects:
+        assert not hasattr(obj, "__dict__"), type(obj).__name__
+
+
+def test_file_registry_reverse_reflections(project: Project) -> None:
+    """The reverse mapping of the file registry is computed once."""
+    files = project.files
+    assert files is not None
+    assert files.reverse_reflections == {1: "1", 30: "2", 22: "3"}
+    assert files.reverse_reflections is files.reverse_reflections
+    assert files.filepath(22) == "src/utils.ts"
+
+
+def test_source_contents(project: Project, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Source lines are read from the project's source cache."""
+    monkeypatch.chdir(FIXTURES_DIR / "project")
+    add, sleep = project.symbol_id_map[23], project.symbol_id_map[27]
+    assert add.sources[0].contents == "export function add(a: number, b: number): number {\n"
+    assert sleep.source_contents == "export async function sleep(ms: number): Promise<void> "
+    assert len(project.source_cache._files) == 1
+
+
+def test_property_errors(project: Project) -> None:
+    """Errors raised inside properties are not replaced by a missing attribute error."""
+    files, project.files = project.files, None
+    try:
+        with pytest.raises(AttributeError, match="filepath"):
+            project.symbol_id_map[23].source_contents  # noqa: B018
+    finally:
+        project.files = files
+
+
+def test_memoized_paths() -> None:
+    """Paths and roots are computed once, and recomputed when the tree changes."""
+    project = load_json(FIXTURES_DIR / "project.json")
+    index, shape, method, utils = (project.symbol_id_map[id_] for id_ in (1, 5, 15, 22))
+    signature = method.signatures[0]  # type: ignore[attr-defined]
+    assert signature.path == "index/Shape/move/move"
+    assert signature.path is signature.path
+    assert signature.root is project
+    assert signature.root_module is index
+
+    index.children.remove(shape)
+    utils.children.append(shape)
+    shape.parent = utils
+    assert signature.path == "utils/Shape/move/move"
+    assert signature.root_module is utils
+
+    utils.name = "helpers"
+    assert signature.path == "helpers/Shape/move/move"
+
+    project.children.remove(utils)
+    utils.parent = None
+    assert signature.root is utils
+    assert signature.path == "helpers/Shape/move/move"
+
+
+def test_path_slots() -> None:
+    """Each reflection class holds its fields once, and wraps its own `name` and `parent` slots."""
+    assert Reflection.__slots__ == ()
+    for cls in _reflection_classes.values():
+        assert len(set(cls.__slots__)) == len(cls.__slots__) == len(fields(cls)), cls.__name__
+        assert isinstance(cls.__dict__["name"], _PathSlot), cls.__name__
+        assert isinstance(cls.__dict__["parent"], _PathSlot), cls.__name__
+
+
+def test_project_reference(project: Project) -> None:
+    """Reflections reference their project directly."""
+    reference = project.symbol_id_map[21]
+    assert reference.project is project
+    assert reference.symbol_map is project.symbol_id_map
+    assert reference.resolved_target is project.symbol_id_map[23]  # type: ignore[attr-defined]
+
+
+def test_lookup() -> None:
+    """Reflections are found by path and by name, and indexes follow renames."""
+    project = load_json(FIXTURES_DIR / "project.json")
+    method = project.lookup("index/Shape/move")
+    assert method is project.symbol_id_map[15]
+    assert project.lookup("index/Shape/move/move") is method.signatures[0]  # type: ignore[attr-defined]
+    assert [reflection.path for reflection in project.lookup_name("add")] == ["utils/add", "utils/add/add"]
+    assert project.lookup_name("missing") == ()
+    with pytest.raises(KeyError):
+        project.lookup("index/Shape/missing")
+
+    project.lookup("index/Shape").name = "Form"
+    assert project.lookup("index/Form/move") is method
+    with pytest.raises(KeyError):
+        project.lookup("index/Shape/move")
+
+
+@pytest.mark.parametrize("reverse_references", [True, False])
+def test_referenced_by(reverse_references: bool) -> None:
+    """Reflections referencing a reflection are found, whether indexed while decoding or not."""
+    project = load_json(FIXTURES_DIR / "project.json", reverse_references=reverse_references)
+    assert (project._references is not None) is reverse_references
+    point = project.symbol_id_map[10]
+    assert [reflection.id for reflection in project.referenced_by(point)] == [8, 9, 20]
+    assert [reflection.id for reflection in project.referenced_by(5)] == [7, 16]
+    assert project.referenced_by(22) == ()
+
+
+@pytest.mark.parametrize("reverse_references", [True, False])
+def test_referenced_by_nested_declaration(reverse_references: bool) -> None:
+    """References are attributed to the reflection declaring the type, not to type literals nested in it."""
+    # `export let x: A | { y: string }`
+    member = {
+        "id": 5,
+        "name": "y",
+        "variant": "declaration",
+        "kind": 1024,
+        "flags": {},
+        "type": {"type": "intrinsic", "name": "string"},
+    }
+    literal = {"id": 4, "name": "__type", "variant": "declaration", "kind": 65536, "flags": {}, "children": [member]}
+    union = {
+        "type": "union",
+        "types": [{"type": "reference", "target": 2, "name": "A"}, {"type": "reflection", "declaration": literal}],
+    }
+    module = {
+        "id": 1,
+        "name": "index",
+        "variant": "declaration",
+        "kind": 2,
+        "flags": {},
+        "children": [
+            {"id": 2, "name": "A", "variant": "declaration", "kind": 256, "flags": {}},
+            {"id": 3, "name": "x", "variant": "declaration", "kind": 32, "flags": {}, "type": union},
+        ],
+    }
+    document = {
+        "id": 0,
+        "name": "nested",
+        "variant": "project",
+        "kind": 1,
+        "flags": {},
+        "packageName": "nested",
+        "children": [module],
+    }
+    project = load_json(json.dumps(document).encode(), reverse_references=reverse_references)
+    assert [reflection.name for reflection in project.referenced_by(2)] == ["x"]
+    assert project.referenced_by(5) == ()
+
+
+def test_resolved_groups() -> None:
+    """Groups are resolved once, and again when they are replaced."""
+    project = load_json(FIXTURES_DIR / "project.json")
+    shape = project.symbol_id_map[5]
+    groups = shape.resolved_groups
+    assert shape.resolved_groups is groups
+    assert [child.id for group in groups for child in group.children] == [  # type: ignore[union-attr]
+        child for group in shape.groups for child in group.children
+    ]
+    assert shape.group_title(project.symbol_id_map[15]) == "Methods"
+    assert shape.group_title(22) is None
+
+    shape.groups = [Group(title="Members", children=[15])]
+    assert shape.resolved_groups is not groups
+    assert shape.group_title(15) == "Members"
+
+
+def test_exports() -> None:
+    """CommonJS exports are computed once, and resolve to their targets."""
+    project = load_json(FIXTURES_DIR / "project.json")
+    legacy = project.symbol_id_map[30]
+    exports = legacy.exports  # type: ignore[attr-defined]
+    assert legacy.exports is exports  # type: ignore[attr-defined]
+    assert [reference.name for reference in exports] == ["add"]
+    assert exports[0].resolved_target is project.symbol_id_map[23]
+    assert exports[0].path == "legacy/add"
+
+    function = project.symbol_id_map[31]
+    function.signatures = list(function.signatures)  # type: ignore[attr-defined]
+    assert function.exports[0] is not exports[0]  # type: ignore[attr-defined]
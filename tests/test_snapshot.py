@@ -0,0 +1,63 @@
+"""Tests for binary snapshots."""
+
+from __future__ import annotations
+
+import copy
+from typing import TYPE_CHECKING
+
+import pytest
+
+from griffe_typedoc import load_json, load_snapshot, save_snapshot
+from griffe_typedoc._internal import snapshot
+from tests import FIXTURES_DIR
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_round_trip(tmp_path: Path) -> None:
+    """Restored projects are identical to saved ones."""
+    project = load_json(FIXTURES_DIR / "project.json")
+    save_snapshot(project, tmp_path / "project.snapshot")
+    restored = load_snapshot(tmp_path / "project.snapshot")
+    assert repr(restored) == repr(project)
+    assert restored.symbol_id_map[16].parent is restored.symbol_id_map[15]
+    assert restored.symbol_id_map[16].project is restored
+    assert restored.symbol_id_map[16].path == project.symbol_id_map[16].path
+
+
+def test_round_trip_memoized_paths(tmp_path: Path) -> None:
+    """Projects whose paths were computed can be saved and restored, or copied."""
+    project = load_json(FIXTURES_DIR / "project.json")
+    paths = {reflection.id: reflection.path for reflection in project.symbol_id_map.values()}
+    save_snapshot(project, tmp_path / "project.snapshot")
+    for restored in (load_snapshot(tmp_path / "project.snapshot"), copy.deepcopy(project)):
+        assert repr(restored) == repr(project)
+        assert {reflection.id: reflection.path for reflection in restored.symbol_id_map.values()} == paths
+        restored.symbol_id_map[15].name = "Renamed"
+        # Memoized paths are still invalidated.
+        assert restored.symbol_id_map[15].path.endswith("/Renamed")
+        assert restored.symbol_id_map[16].path.startswith(restored.symbol_id_map[15].path + "/")
+
+
+def test_round_trip_lazy(tmp_path: Path) -> None:
+    """Lazily loaded projects are converted before being saved."""
+    contents = FIXTURES_DIR.joinpath("project.json").read_bytes()
+    project = load_json(contents, lazy=True)
+    save_snapshot(project, tmp_path / "project.snapshot")
+    restored = load_snapshot(tmp_path / "project.snapshot")
+    assert repr(restored) == repr(load_json(contents))
+    assert all(reflection._lazy is None for reflection in restored.symbol_id_map.values())
+
+
+@pytest.mark.parametrize(
+    ("data", "message"),
+    [
+        (b"{}", "Not a griffe-typedoc snapshot"),
+        (snapshot._MAGIC + b"\xff\xff", "incompatible version"),
+    ],
+)
+def test_invalid_snapshots(data: bytes, message: str) -> None:
+    """Invalid or incompatible snapshots are rejected."""
+    with pytest.raises(ValueError, match=message):
+        load_snapshot(data)
@@ -0,0 +1,76 @@
+"""Tests for the source cache."""
+
+from __future__ import annotations
+
+import pickle
+from typing import TYPE_CHECKING
+
+import pytest
+
+from griffe_typedoc import SourceCache
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_read_lines(tmp_path: Path) -> None:
+    """Lines are read with their trailing newline, Windows line endings are normalized."""
+    path = tmp_path / "file.ts"
+    path.write_bytes(b"first\r\nsecond\n\nlast")
+    cache = SourceCache()
+    assert [cache.line(path, lineno) for lineno in range(1, 5)] == ["first\n", "second\n", "\n", "last"]
+    for lineno in (0, 5):
+        with pytest.raises(IndexError):
+            cache.line(path, lineno)
+
+
+def test_read_file_once(tmp_path: Path) -> None:
+    """Files are read once, missing files included."""
+    path = tmp_path / "file.ts"
+    path.write_text("before\n")
+    cache = SourceCache()
+    assert cache.line(path, 1) == "before\n"
+    with pytest.raises(FileNotFoundError):
+        cache.line(tmp_path / "missing.ts", 1)
+    path.unlink()
+    (tmp_path / "missing.ts").write_text("created\n")
+    assert cache.line(path, 1) == "before\n"
+    with pytest.raises(FileNotFoundError):
+        cache.line(tmp_path / "missing.ts", 1)
+    cache.clear()
+    assert cache.line(tmp_path / "missing.ts", 1) == "created\n"
+
+
+def test_empty_file(tmp_path: Path) -> None:
+    """Empty files have no lines."""
+    path = tmp_path / "empty.ts"
+    path.touch()
+    with pytest.raises(IndexError):
+        SourceCache().line(path, 1)
+
+
+def test_evict_least_recently_used(tmp_path: Path) -> None:
+    """The least recently used file is evicted when too many files are cached."""
+    paths = [tmp_path / f"file{index}.ts" for index in range(3)]
+    for path in paths:
+        path.write_text(f"{path.name}\n")
+    cache = SourceCache(max_files=2)
+    cache.line(paths[0], 1)
+    cache.line(paths[1], 1)
+    cache.line(paths[0], 1)
+    cache.line(paths[2], 1)
+    paths[0].write_text("changed\n")
+    paths[1].write_text("changed\n")
+    assert cache.line(paths[0], 1) == "file0.ts\n"
+    assert cache.line(paths[1], 1) == "changed\n"
+
+
+def test_pickle(tmp_path: Path) -> None:
+    """Pickled caches are empty."""
+    path = tmp_path / "file.ts"
+    path.write_text("line\n")
+    cache = SourceCache(max_files=3)
+    cache.line(path, 1)
+    unpickled = pickle.loads(pickle.dumps(cache))  # noqa: S301
+    assert unpickled.max_files == 3
+    assert not unpickled._files
@@ -0,0 +1,114 @@
+"""Tests for the project watcher."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from griffe_typedoc import ProjectWatcher
+from tests import FIXTURES_DIR
+from tests.conftest import FAKE_TYPEDOC
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture(name="data")
+def _fixture_data() -> dict[str, Any]:
+    return json.loads(FIXTURES_DIR.joinpath("project.json").read_text())
+
+
+def _change(project_dir: Path, monkeypatch: pytest.MonkeyPatch, data: dict[str, Any], source: str) -> None:
+    output = project_dir.parent / "output.json"
+    output.write_text(json.dumps(data))
+    monkeypatch.setenv("FAKE_TYPEDOC_OUTPUT", str(output))
+    with project_dir.joinpath(source).open("a") as file:
+        file.write("// Changed.\n")
+
+
+def test_no_changes(project_dir: Path, calls_file: Path) -> None:
+    """TypeDoc does not run again when sources did not change."""
+    watcher = ProjectWatcher(FAKE_TYPEDOC, str(project_dir))
+    watcher.load()
+    assert watcher.check() is None
+    assert len(calls_file.read_text().splitlines()) == 1
+
+
+def test_patch_changed_module(project_dir: Path, monkeypatch: pytest.MonkeyPatch, data: dict[str, Any]) -> None:
+    """Only the modules that changed are replaced."""
+    watcher = ProjectWatcher(FAKE_TYPEDOC, str(project_dir))
+    project = watcher.load()
+    index, legacy, utils = project.children
+    shape = project.symbol_id_map[5]
+
+    data["children"][2]["children"][0]["comment"] = {"summary": [{"kind": "text", "text": "Add numbers."}]}
+    _change(project_dir, monkeypatch, data, "src/utils.ts")
+    changes = watcher.check()
+
+    assert changes
+    assert changes.files == [str(project_dir / "src/utils.ts")]
+    assert not changes.added
+    assert not changes.removed
+    assert changes.changed == [project.children[2]]
+    assert project.children[:2] == [index, legacy]
+    assert project.children[0] is index
+    assert project.symbol_id_map[5] is shape
+    add = project.symbol_id_map[23]
+    assert str(add.comment) == "Add numbers."
+    assert add.project is project
+    assert add.root is project
+    assert project.children[2] is not utils
+    assert project.children[2].parent is project
+
+
+def test_add_and_remove_modules(project_dir: Path, monkeypatch: pytest.MonkeyPatch, data: dict[str, Any]) -> None:
+    """Added and removed modules are reported."""
+    watcher = ProjectWatcher(FAKE_TYPEDOC, str(project_dir))
+    project = watcher.load()
+    legacy = project.children[1]
+    assert project.lookup("legacy") is legacy
+
+    data["children"][1]["name"] = "compat"
+    _change(project_dir, monkeypatch, data, "src/legacy.ts")
+    changes = watcher.check()
+
+    assert changes
+    assert changes.removed == [legacy]
+    assert [module.name for module in changes.added] == ["compat"]
+    assert [module.name for module in project.children] == ["index", "compat", "utils"]
+    assert project.symbol_id_map[30] is changes.added[0]
+    assert project.lookup("compat") is changes.added[0]
+
+
+@pytest.mark.parametrize("failure", ["exit code", "empty output"])
+def test_typedoc_failure(
+    project_dir: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+    data: dict[str, Any],
+    failure: str,
+) -> None:
+    """The current project is kept when TypeDoc fails, and reloaded on the next change."""
+    watcher = ProjectWatcher(FAKE_TYPEDOC, str(project_dir))
+    project = watcher.load()
+    children = list(project.children)
+
+    if failure == "exit code":
+        monkeypatch.setenv("FAKE_TYPEDOC_EXIT_CODE", "2")
+    else:
+        empty_output = project_dir.parent / "empty.json"
+        empty_output.write_text("")
+        monkeypatch.setenv("FAKE_TYPEDOC_OUTPUT", str(empty_output))
+    with project_dir.joinpath("src/utils.ts").open("a") as file:
+        file.write("export const broken = ;\n")
+    assert watcher.check() is None
+    assert "Could not reload project" in caplog.text
+    assert watcher.project is project
+    assert project.children == children
+    assert watcher.check() is None
+
+    monkeypatch.delenv("FAKE_TYPEDOC_EXIT_CODE", raising=False)
+    _change(project_dir, monkeypatch, data, "src/utils.ts")
+    assert watcher.check() is not None
@@ -0,0 +1,50 @@
+"""Tests for the TypeDoc worker."""
+
+from __future__ import annotations
+
+import sys
+from typing import TYPE_CHECKING
+
+import pytest
+
+from griffe_typedoc import TypedocWorker
+from tests import FIXTURES_DIR
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+FAKE_WORKER = [sys.executable, str(FIXTURES_DIR / "fake_typedoc_worker.py")]
+
+
+def test_reuse_worker(calls_file: Path, caplog: pytest.LogCaptureFixture) -> None:
+    """The same worker process converts the project on each load."""
+    caplog.set_level("WARNING")
+    with TypedocWorker(str(FIXTURES_DIR / "project"), command=FAKE_WORKER, typedoc_options=["--opt"]) as worker:
+        first = worker.load()
+        second = worker.load()
+        assert worker.running
+    assert not worker.running
+    assert first is not second
+    assert second.symbol_id_map[16].parent is second.symbol_id_map[15]
+    assert calls_file.read_text().splitlines() == ["--opt"]
+    assert caplog.text.count("Some symbols are not exported") == 2
+
+
+def test_conversion_error() -> None:
+    """Conversion errors are raised, and the worker keeps running."""
+    with TypedocWorker(command=FAKE_WORKER, typedoc_options=["--fail"]) as worker:
+        for _ in range(2):
+            with pytest.raises(RuntimeError, match="Found 1 error"):
+                worker.load()
+        assert worker.running
+
+
+def test_restart_after_crash(calls_file: Path) -> None:
+    """A worker that died is restarted on next load."""
+    with TypedocWorker(command=FAKE_WORKER, typedoc_options=["--crash"]) as worker:
+        with pytest.raises(RuntimeError, match="exited unexpectedly"):
+            worker.load()
+        assert not worker.running
+        with pytest.raises(RuntimeError, match="exited unexpectedly"):
+            worker.load()
+    assert len(calls_file.read_text().splitlines()) == 2